@@ -7,7 +7,7 @@ consistent behavior across different backends.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Optional, List, Callable
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
 if TYPE_CHECKING:
     from ..element import Element
@@ -23,9 +23,15 @@ class BaseAdapter(ABC):
     - Hit testing
     """
 
+    # Tags that can receive focus (when enabled and visible)
+    FOCUSABLE_TAGS = frozenset((
+        "button", "input", "checkbox", "select", "textarea", "toggle", "slider",
+    ))
+
     def __init__(self) -> None:
         """Initialize the adapter."""
         self._focusable: List["Element"] = []
+        self._focus_positions: Dict[int, int] = {}  # element.id -> index in _focusable
         self._focus_index: int = -1
         self._focused: Optional["Element"] = None
         self._hovered: Optional["Element"] = None
@@ -55,6 +61,16 @@ class BaseAdapter(ABC):
         """Stop the main event loop."""
         pass
 
+    def reset(self) -> None:
+        """Clear focus, hover and edit state so the adapter can be reused."""
+        self._focusable = []
+        self._focus_positions = {}
+        self._focus_index = -1
+        self._focused = None
+        self._hovered = None
+        self._edit_mode = False
+        self._dirty = True
+
     def invalidate(self) -> None:
         """Mark the display as needing re-render."""
         self._dirty = True
@@ -110,8 +126,9 @@ class BaseAdapter(ABC):
 
     def focus_element(self, element: "Element") -> None:
         """Focus a specific element."""
-        if element in self._focusable:
-            self._focus_index = self._focusable.index(element)
+        index = self._focus_positions.get(element.id)
+        if index is not None:
+            self._focus_index = index
             self._focused = element
             self._dirty = True
 
@@ -140,8 +157,7 @@ class BaseAdapter(ABC):
 
     def _is_focusable(self, element: "Element") -> bool:
         """Check if element can receive focus."""
-        focusable_tags = ("button", "input", "checkbox", "select", "textarea", "toggle", "slider")
-        if element.tag not in focusable_tags:
+        if element.tag not in self.FOCUSABLE_TAGS:
             return False
         if not getattr(element, "enabled", True):
             return False
@@ -36,7 +36,7 @@ ROBOTO_URLS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class RenderNode:
     """Node in the render tree with computed layout and caching."""
 
@@ -170,6 +170,7 @@ class TkinterAdapter(BaseAdapter):
         height: int = 600,
         title: str = "RawGUI",
         dark: bool = True,
+        render_pixels: bool = True,
     ) -> None:
         """Initialize the Tkinter adapter.
 
@@ -178,6 +179,8 @@ class TkinterAdapter(BaseAdapter):
             height: Window height in pixels
             title: Window title
             dark: Use dark theme
+            render_pixels: Paint layers on render; False builds only the
+                render tree (layout, focus, hit testing)
         """
         super().__init__()
 
@@ -185,6 +188,7 @@ class TkinterAdapter(BaseAdapter):
         self.height = height
         self.title = title
         self.dark = dark
+        self.render_pixels = render_pixels
 
         # Tkinter components (created in run())
         self._root: Optional[tk.Tk] = None
@@ -236,11 +240,27 @@ class TkinterAdapter(BaseAdapter):
             return self._create_layer(name)
         return self._layers[name]
 
+    def reset(self) -> None:
+        """Drop render state for reuse, keeping fonts and the base layer.
+
+        Only valid for headless use; native widgets are not touched.
+        """
+        super().reset()
+        self._render_tree = None
+        self._element_map.clear()
+        self._node_cache.clear()
+        self._pending_focus_index = None
+        self._root_element = None
+        self._client = None
+        self._rebuild_callback = None
+        self._layers = {"base": self._layers["base"]}
+
     def render(self, root: "Element") -> None:
         """Render the element tree to Pillow image."""
         self._root_element = root
         self._element_map.clear()
         self._focusable.clear()
+        self._focus_positions.clear()
 
         # Build render tree
         self._render_tree = self._build_render_tree(root, 0, 0, self.width, self.height)
@@ -260,6 +280,11 @@ class TkinterAdapter(BaseAdapter):
             self._focus_index = 0
             self._focused = self._focusable[0]
 
+        # Structure-only mode: layout is done, skip painting
+        if not self.render_pixels:
+            self._dirty = False
+            return
+
         # Clear base layer
         base_layer = self._get_layer("base")
         base_layer.image = Image.new("RGBA", (self.width, self.height), self.COLORS["background"])
@@ -442,6 +467,7 @@ class TkinterAdapter(BaseAdapter):
     def _index_focusable(self, node: RenderNode) -> None:
         """Index focusable elements in render tree."""
         if node.element and self._is_focusable(node.element):
+            self._focus_positions[node.element.id] = len(self._focusable)
             self._focusable.append(node.element)
             node.focused = node.element == self._focused
 
@@ -1038,7 +1064,13 @@ class TkinterAdapter(BaseAdapter):
 
         Returns:
             PIL Image of the current render
+
+        Raises:
+            RuntimeError: If pixel rendering is disabled
         """
+        if not self.render_pixels:
+            raise RuntimeError("pixel rendering disabled")
+
         # Composite all layers
         sorted_layers = sorted(self._layers.values(), key=lambda l: l.z_index)
         result = Image.new("RGBA", (self.width, self.height), self.COLORS["background"])
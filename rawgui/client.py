@@ -8,8 +8,10 @@ Each client has its own SessionConfig for multi-session support.
 
 from __future__ import annotations
 
+import threading
 import uuid
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .context import context
 from .config import SessionConfig
@@ -37,6 +39,9 @@ class Client:
     page_routes: Dict[Callable, str] = {}
     page_configs: Dict[Callable, "PageConfig"] = {}
 
+    # Per-thread reusable client (see get_pooled)
+    _pool = threading.local()
+
     def __init__(
         self,
         client_id: Optional[str] = None,
@@ -71,9 +76,44 @@ class Client:
         self.connect_handlers: List[Callable] = []
         self.disconnect_handlers: List[Callable] = []
 
+        # Element event and callback calls deferred by batch(), keyed by
+        # (element id, event name) (None when not batching)
+        self._batched_events: Optional[
+            Dict[Tuple[int, str], Tuple[Callable, tuple, Dict[str, Any]]]
+        ] = None
+
         # Register this client
         Client.instances[self.id] = self
 
+    @classmethod
+    def get_pooled(cls) -> "Client":
+        """Get this thread's reusable client, reset to a fresh state.
+
+        Building many short-lived element trees (e.g. dialogs or tests) can
+        share one client instead of creating and registering a new one each
+        time. The previous tree is cleared on acquire, not on exit, so its
+        elements stay usable after leaving the ``with`` block.
+
+        Returns:
+            The pooled client for the current thread
+        """
+        client = getattr(cls._pool, "client", None)
+        if client is None:
+            client = cls._pool.client = cls()
+        else:
+            client.reset()
+        return client
+
+    def reset(self) -> None:
+        """Clear elements, navigation and session state, keeping id and config."""
+        self.clear()
+        self.current_path = "/"
+        self.history.clear()
+        self.history_index = -1
+        self.storage.clear()
+        self.connect_handlers.clear()
+        self.disconnect_handlers.clear()
+
     def __enter__(self) -> "Client":
         """Enter the client context for building UI."""
         context.client = self
@@ -83,6 +123,49 @@ class Client:
         """Exit the client context."""
         context.client = None
 
+    @contextmanager
+    def batch(self) -> Iterator["Client"]:
+        """Defer element events until the block ends, then fire each once.
+
+        Events fired inside the block are queued per (element, event) and
+        fired with their latest arguments when the block exits normally, so
+        a burst of changes (e.g. a held key) runs each handler once.
+        Nested batches are flushed by the outermost one.
+
+        Yields:
+            This client
+        """
+        if self._batched_events is not None:
+            yield self
+            return
+
+        events = self._batched_events = {}
+        try:
+            yield self
+        finally:
+            self._batched_events = None
+        for func, args, kwargs in events.values():
+            func(*args, **kwargs)
+
+    def _queue_event(
+        self,
+        key: Tuple[int, str],
+        func: Callable,
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Queue a call during batch(), replacing an earlier one with the same key.
+
+        Args:
+            key: (element id, event name) identifying the call
+            func: Function to call when the batch ends
+            args: Positional arguments of the latest call
+            kwargs: Keyword arguments of the latest call
+        """
+        # Re-insert so events fire in the order of their latest occurrence
+        self._batched_events.pop(key, None)
+        self._batched_events[key] = (func, args, kwargs)
+
     def register_element(self, element: "Element") -> None:
         """Register an element with this client.
 
@@ -7,6 +7,7 @@ and the element tree structure.
 from __future__ import annotations
 
 import itertools
+import sys
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -64,7 +65,8 @@ class Element:
             _client: Optional explicit client (defaults to current context)
         """
         self.id = _next_element_id()
-        self.tag = tag or self.__class__.__name__.lower()
+        # Interned, so tag comparisons in renderers hit the identity fast path
+        self.tag = sys.intern(tag or self.__class__.__name__.lower())
 
         # Get client from context or explicit parameter
         self.client = _client or context.client
@@ -282,11 +284,38 @@ class Element:
         return self
 
     def _fire_event(self, event: str, *args, **kwargs) -> None:
-        """Fire an event, calling all registered handlers."""
-        handlers = self._event_handlers.get(event, [])
+        """Fire an event, calling all registered handlers.
+
+        Inside ``Client.batch()`` the event is queued and fired when the
+        batch ends instead.
+        """
+        # Empty tuple default: no list is allocated when nothing is registered
+        handlers = self._event_handlers.get(event, ())
+        if not handlers:
+            return
+        client = self.client
+        if client is not None and client._batched_events is not None:
+            client._queue_event((self.id, event), self._fire_event, (event, *args), kwargs)
+            return
         for handler in handlers:
             handler(*args, **kwargs)
 
+    def _fire_change(self, value: Any) -> None:
+        """Fire the "change" event, then the ``on_change`` constructor callback.
+
+        Inside ``Client.batch()`` both are queued and called once, with the
+        latest value, when the batch ends.
+        """
+        self._fire_event("change", value)
+        callback = getattr(self, "_on_change", None)
+        if callback is None:
+            return
+        client = self.client
+        if client is not None and client._batched_events is not None:
+            client._queue_event((self.id, "on_change"), callback, (value,), {})
+            return
+        callback(value)
+
     # -------------------------------------------------------------------------
     # Tree operations
     # -------------------------------------------------------------------------
@@ -1,38 +1,128 @@
 """RawGUI UI elements.
 
-All elements are imported here for convenient access.
+All elements are accessible here for convenient access. Element modules are
+imported lazily on first attribute access (PEP 562), so applications only pay
+for the elements they actually use.
 """
 
-from .button import Button
-from .card import Card, CardSection, CardActions
-from .chat import ChatMessage, Log
-from .checkbox import Checkbox
-from .column import Column
-from .dialog import Dialog, Notification
-from .image import Avatar, Icon, Image
-from .input import Input
-from .label import Label
-from .layout import Header, Footer, Drawer, LeftDrawer, RightDrawer, PageSticky, Grid, Splitter
-from .link import Code, Html, Link, Markdown
-from .menu import ContextMenu, Menu, MenuItem, MenuSeparator
-from .navbar import NavigationBar
-from .native_widget import NativeWidget
-from .number import ColorPicker, DatePicker, Number, TimePicker
-from .progress import CircularProgress, LinearProgress, ProgressBar
-from .radio import Radio
-from .row import Row
-from .scroll import Expansion, ScrollArea
-from .select import Select
-from .separator import Divider, Separator, Space
-from .slider import Knob, Slider
-from .table import Table
-from .tabs import Tab, TabPanel, TabPanels, Tabs
-from .textarea import Editor, Textarea
-from .toggle import Switch, Toggle
-from .tooltip import Badge, Chip, Tooltip
-from .tree import Tree
+from __future__ import annotations
 
-__all__ = [
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from .button import Button
+    from .card import Card, CardSection, CardActions
+    from .chat import ChatMessage, Log
+    from .checkbox import Checkbox
+    from .column import Column
+    from .dialog import Dialog, Notification
+    from .image import Avatar, Icon, Image
+    from .input import Input
+    from .label import Label
+    from .layout import Header, Footer, Drawer, LeftDrawer, RightDrawer, PageSticky, Grid, Splitter
+    from .link import Code, Html, Link, Markdown
+    from .menu import ContextMenu, Menu, MenuItem, MenuSeparator
+    from .navbar import NavigationBar
+    from .native_widget import NativeWidget
+    from .number import ColorPicker, DatePicker, Number, TimePicker
+    from .progress import CircularProgress, LinearProgress, ProgressBar
+    from .radio import Radio
+    from .row import Row
+    from .scroll import Expansion, ScrollArea
+    from .select import Select
+    from .separator import Divider, Separator, Space
+    from .slider import Knob, Slider
+    from .table import Table
+    from .tabs import Tab, TabPanel, TabPanels, Tabs
+    from .textarea import Editor, Textarea
+    from .toggle import Switch, Toggle
+    from .tooltip import Badge, Chip, Tooltip
+    from .tree import Tree
+
+# Element class name -> submodule that defines it
+_LAZY: Dict[str, str] = {
+    "Button": ".button",
+    "Card": ".card",
+    "CardSection": ".card",
+    "CardActions": ".card",
+    "ChatMessage": ".chat",
+    "Log": ".chat",
+    "Checkbox": ".checkbox",
+    "Column": ".column",
+    "Dialog": ".dialog",
+    "Notification": ".dialog",
+    "Avatar": ".image",
+    "Icon": ".image",
+    "Image": ".image",
+    "Input": ".input",
+    "Label": ".label",
+    "Header": ".layout",
+    "Footer": ".layout",
+    "Drawer": ".layout",
+    "LeftDrawer": ".layout",
+    "RightDrawer": ".layout",
+    "PageSticky": ".layout",
+    "Grid": ".layout",
+    "Splitter": ".layout",
+    "Code": ".link",
+    "Html": ".link",
+    "Link": ".link",
+    "Markdown": ".link",
+    "ContextMenu": ".menu",
+    "Menu": ".menu",
+    "MenuItem": ".menu",
+    "MenuSeparator": ".menu",
+    "NavigationBar": ".navbar",
+    "NativeWidget": ".native_widget",
+    "ColorPicker": ".number",
+    "DatePicker": ".number",
+    "Number": ".number",
+    "TimePicker": ".number",
+    "CircularProgress": ".progress",
+    "LinearProgress": ".progress",
+    "ProgressBar": ".progress",
+    "Radio": ".radio",
+    "Row": ".row",
+    "Expansion": ".scroll",
+    "ScrollArea": ".scroll",
+    "Select": ".select",
+    "Divider": ".separator",
+    "Separator": ".separator",
+    "Space": ".separator",
+    "Knob": ".slider",
+    "Slider": ".slider",
+    "Table": ".table",
+    "Tab": ".tabs",
+    "TabPanel": ".tabs",
+    "TabPanels": ".tabs",
+    "Tabs": ".tabs",
+    "Editor": ".textarea",
+    "Textarea": ".textarea",
+    "Switch": ".toggle",
+    "Toggle": ".toggle",
+    "Badge": ".tooltip",
+    "Chip": ".tooltip",
+    "Tooltip": ".tooltip",
+    "Tree": ".tree",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import element classes on first access and cache them on the module."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__all__ = (
     # Core layout
     "Column",
     "Row",
@@ -107,4 +197,4 @@ __all__ = [
     "Avatar",
     # Native (Tkinter-only)
     "NativeWidget",
-]
+)
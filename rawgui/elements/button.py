@@ -44,7 +44,7 @@ class Button(DisableableElement, TextElement, Element):
         if disabled:
             self.disable()
 
-        if on_click:
+        if on_click is not None:
             self.on_click(on_click)
 
     def on_click(self, handler: Callable) -> "Button":
@@ -37,7 +37,7 @@ class Checkbox(DisableableElement, Element):
         self.text = text
         self._value = value
 
-        if on_change:
+        if on_change is not None:
             self.on("change", on_change)
 
     @property
@@ -54,8 +54,9 @@ class Checkbox(DisableableElement, Element):
 
     def toggle(self) -> None:
         """Toggle the checkbox state."""
-        if self.enabled:
-            self.value = not self.value
+        # Read the backing fields directly; only the setter needs dispatch
+        if self._enabled:
+            self.value = not self._value
 
     def on_change(self, handler: Callable[[bool], None]) -> "Checkbox":
         """Register a change handler.
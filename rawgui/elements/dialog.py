@@ -98,7 +98,7 @@ class Dialog(Element):
             self._is_open = False
             self.visible = False
             self._fire_event("close")
-            if self._on_close:
+            if self._on_close is not None:
                 self._on_close()
 
     def toggle(self) -> None:
@@ -46,7 +46,7 @@ class Input(DisableableElement, ValueElement[str], Element):
         # Cursor position for text editing (0 = before first char)
         self._cursor_pos: int = len(value)
 
-        if on_change:
+        if on_change is not None:
             self.on_change(on_change)
 
     def on_change(self, handler: Callable) -> "Input":
@@ -159,15 +159,41 @@ class Drawer(Element):
 class LeftDrawer(Drawer):
     """Left-side drawer."""
 
-    def __init__(self, **kwargs) -> None:
-        super().__init__(side="left", **kwargs)
+    def __init__(
+        self,
+        *,
+        value: bool = False,
+        fixed: bool = True,
+        top_corner: bool = False,
+        bottom_corner: bool = False,
+    ) -> None:
+        super().__init__(
+            side="left",
+            value=value,
+            fixed=fixed,
+            top_corner=top_corner,
+            bottom_corner=bottom_corner,
+        )
 
 
 class RightDrawer(Drawer):
     """Right-side drawer."""
 
-    def __init__(self, **kwargs) -> None:
-        super().__init__(side="right", **kwargs)
+    def __init__(
+        self,
+        *,
+        value: bool = False,
+        fixed: bool = True,
+        top_corner: bool = False,
+        bottom_corner: bool = False,
+    ) -> None:
+        super().__init__(
+            side="right",
+            value=value,
+            fixed=fixed,
+            top_corner=top_corner,
+            bottom_corner=bottom_corner,
+        )
 
 
 class PageSticky(Element):
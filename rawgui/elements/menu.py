@@ -41,12 +41,12 @@ class MenuItem(Element):
         self._on_click = on_click
         self.auto_close = auto_close
 
-        if on_click:
+        if on_click is not None:
             self.on("click", lambda: on_click())
 
     def click(self) -> None:
         """Trigger click action."""
-        if self._on_click:
+        if self._on_click is not None:
             self._on_click()
 
 
@@ -139,5 +139,4 @@ class MenuSeparator(Element):
 
     def __init__(self) -> None:
         """Create a menu separator."""
-        super().__init__()
-        self.tag = "menu_separator"
+        super().__init__(tag="menu_separator")
@@ -63,7 +63,13 @@ class NativeWidget(Element):
                            a Tkinter widget. The widget will be packed into the frame.
             width: Width in pixels
             height: Height in pixels
+
+        Raises:
+            TypeError: If widget_factory is None
         """
+        # Fail here rather than later, when the adapter creates the widget
+        if widget_factory is None:
+            raise TypeError("widget_factory must not be None")
         super().__init__(tag="native_widget")
 
         self.widget_factory = widget_factory
@@ -89,9 +89,7 @@ class Number(DisableableElement, Element):
         self._value = val
 
         if old != val:
-            self._fire_event("change", val)
-            if self._on_change:
-                self._on_change(val)
+            self._fire_change(val)
 
     @property
     def display_value(self) -> str:
@@ -169,9 +167,7 @@ class ColorPicker(Element):
         old = self._value
         self._value = val
         if old != val:
-            self._fire_event("change", val)
-            if self._on_change:
-                self._on_change(val)
+            self._fire_change(val)
 
 
 class DatePicker(Element):
@@ -212,9 +208,7 @@ class DatePicker(Element):
         old = self._value
         self._value = val
         if old != val:
-            self._fire_event("change", val)
-            if self._on_change:
-                self._on_change(val)
+            self._fire_change(val)
 
 
 class TimePicker(Element):
@@ -255,6 +249,4 @@ class TimePicker(Element):
         old = self._value
         self._value = val
         if old != val:
-            self._fire_event("change", val)
-            if self._on_change:
-                self._on_change(val)
+            self._fire_change(val)
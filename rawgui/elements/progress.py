@@ -134,7 +134,5 @@ class CircularProgress(Element):
         self._frame = (self._frame + 1) % len(self.SPINNER_FRAMES)
 
 
-class LinearProgress(ProgressBar):
-    """Alias for ProgressBar (NiceGUI compatibility)."""
-
-    pass
+# Alias for ProgressBar (NiceGUI compatibility)
+LinearProgress = ProgressBar
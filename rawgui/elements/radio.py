@@ -5,7 +5,7 @@ NiceGUI-compatible radio button group.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from ..element import Element
 from ..mixins import DisableableElement
@@ -40,21 +40,29 @@ class Radio(DisableableElement, Element):
         """
         super().__init__()
         self.tag = "radio"
-        self._options = self._normalize_options(options)
+        self._set_options(options)
         self._value = value
         self._on_change = on_change
 
         # UI state
         self._focused_index = 0
 
-    def _normalize_options(
-        self, options: Union[List[Any], Dict[Any, str]]
-    ) -> List[Dict[str, Any]]:
-        """Convert options to normalized format."""
+    def _set_options(self, options: Union[List[Any], Dict[Any, str]]) -> None:
+        """Normalize options once into parallel value/label tuples.
+
+        The list/dict distinction is resolved here, so lookups and rendering
+        work on one uniform layout. ``_options`` keeps the dict form for the
+        public ``options`` property.
+        """
         if isinstance(options, dict):
-            return [{"value": k, "label": str(v)} for k, v in options.items()]
+            self._values: Tuple[Any, ...] = tuple(options)
+            self._labels: Tuple[str, ...] = tuple(str(v) for v in options.values())
         else:
-            return [{"value": o, "label": str(o)} for o in options]
+            self._values = tuple(options)
+            self._labels = tuple(str(o) for o in self._values)
+        self._options = [
+            {"value": v, "label": label} for v, label in zip(self._values, self._labels)
+        ]
 
     @property
     def options(self) -> List[Dict[str, Any]]:
@@ -64,7 +72,7 @@ class Radio(DisableableElement, Element):
     @options.setter
     def options(self, value: Union[List[Any], Dict[Any, str]]) -> None:
         """Set options."""
-        self._options = self._normalize_options(value)
+        self._set_options(value)
 
     @property
     def value(self) -> Any:
@@ -77,9 +85,7 @@ class Radio(DisableableElement, Element):
         old_value = self._value
         self._value = val
         if old_value != val:
-            self._fire_event("change", val)
-            if self._on_change:
-                self._on_change(val)
+            self._fire_change(val)
 
     def select(self, value: Any) -> None:
         """Select a value."""
@@ -87,28 +93,16 @@ class Radio(DisableableElement, Element):
 
     def next(self) -> None:
         """Select next option."""
-        if not self._options:
+        if not self._values:
             return
 
-        current_idx = -1
-        for i, opt in enumerate(self._options):
-            if opt["value"] == self._value:
-                current_idx = i
-                break
-
-        next_idx = (current_idx + 1) % len(self._options)
-        self.value = self._options[next_idx]["value"]
+        current_idx = self._values.index(self._value) if self._value in self._values else -1
+        self.value = self._values[(current_idx + 1) % len(self._values)]
 
     def prev(self) -> None:
         """Select previous option."""
-        if not self._options:
+        if not self._values:
             return
 
-        current_idx = 0
-        for i, opt in enumerate(self._options):
-            if opt["value"] == self._value:
-                current_idx = i
-                break
-
-        prev_idx = (current_idx - 1) % len(self._options)
-        self.value = self._options[prev_idx]["value"]
+        current_idx = self._values.index(self._value) if self._value in self._values else 0
+        self.value = self._values[(current_idx - 1) % len(self._values)]
@@ -5,7 +5,7 @@ NiceGUI-compatible dropdown selection component.
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from ..element import Element
 from ..mixins import DisableableElement
@@ -50,7 +50,7 @@ class Select(DisableableElement, Element):
         super().__init__()
         self.tag = "select"
         self.label = label
-        self._options = self._normalize_options(options)
+        self._set_options(options)
         self._value = value if value is not None else ([] if multiple else None)
         self._on_change = on_change
         self.with_input = with_input
@@ -62,14 +62,22 @@ class Select(DisableableElement, Element):
         self._filter_text = ""
         self._highlighted_index = 0
 
-    def _normalize_options(
-        self, options: Union[List[Any], Dict[Any, str]]
-    ) -> List[Dict[str, Any]]:
-        """Convert options to normalized format."""
+    def _set_options(self, options: Union[List[Any], Dict[Any, str]]) -> None:
+        """Normalize options once into parallel value/label tuples.
+
+        The list/dict distinction is resolved here, so lookups and rendering
+        work on one uniform layout. ``_options`` keeps the dict form for the
+        public ``options`` property.
+        """
         if isinstance(options, dict):
-            return [{"value": k, "label": str(v)} for k, v in options.items()]
+            self._values: Tuple[Any, ...] = tuple(options)
+            self._labels: Tuple[str, ...] = tuple(str(v) for v in options.values())
         else:
-            return [{"value": o, "label": str(o)} for o in options]
+            self._values = tuple(options)
+            self._labels = tuple(str(o) for o in self._values)
+        self._options = [
+            {"value": v, "label": label} for v, label in zip(self._values, self._labels)
+        ]
 
     @property
     def options(self) -> List[Dict[str, Any]]:
@@ -79,7 +87,7 @@ class Select(DisableableElement, Element):
     @options.setter
     def options(self, value: Union[List[Any], Dict[Any, str]]) -> None:
         """Set options."""
-        self._options = self._normalize_options(value)
+        self._set_options(value)
 
     @property
     def value(self) -> Any:
@@ -92,9 +100,7 @@ class Select(DisableableElement, Element):
         old_value = self._value
         self._value = val
         if old_value != val:
-            self._fire_event("change", val)
-            if self._on_change:
-                self._on_change(val)
+            self._fire_change(val)
 
     @property
     def display_value(self) -> str:
@@ -104,18 +110,12 @@ class Select(DisableableElement, Element):
 
         if self.multiple:
             values = self._value if isinstance(self._value, list) else [self._value]
-            labels = []
-            for v in values:
-                for opt in self._options:
-                    if opt["value"] == v:
-                        labels.append(opt["label"])
-                        break
-            return ", ".join(labels)
-        else:
-            for opt in self._options:
-                if opt["value"] == self._value:
-                    return opt["label"]
-            return str(self._value)
+            return ", ".join(
+                self._labels[self._values.index(v)] for v in values if v in self._values
+            )
+        if self._value in self._values:
+            return self._labels[self._values.index(self._value)]
+        return str(self._value)
 
     def open(self) -> None:
         """Open the dropdown."""
@@ -143,9 +143,7 @@ class Select(DisableableElement, Element):
                 self._value.remove(value)
             else:
                 self._value.append(value)
-            self._fire_event("change", self._value)
-            if self._on_change:
-                self._on_change(self._value)
+            self._fire_change(self._value)
         else:
             self.value = value
             self.close()
@@ -161,6 +159,6 @@ class Select(DisableableElement, Element):
         value: Any = None,
     ) -> None:
         """Update options and optionally set value."""
-        self._options = self._normalize_options(options)
+        self._set_options(options)
         if value is not None:
             self.value = value
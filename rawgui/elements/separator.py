@@ -23,6 +23,11 @@ class Separator(Element):
         ui.separator(vertical=True)
     """
 
+    # Defaults live on the class, so separators created without arguments
+    # (the common case) share them instead of storing copies per instance
+    vertical: bool = False
+    char: str = "-"
+
     def __init__(
         self,
         *,
@@ -35,10 +40,12 @@ class Separator(Element):
             vertical: Vertical orientation (default horizontal)
             char: Character to use (default: '-' or '|')
         """
-        super().__init__()
-        self.tag = "separator"
-        self.vertical = vertical
-        self.char = char or ("|" if vertical else "-")
+        super().__init__(tag="separator")
+        if vertical:
+            self.vertical = True
+            self.char = char or "|"
+        elif char:
+            self.char = char
 
 
 class Space(Element):
@@ -52,6 +59,9 @@ class Space(Element):
         ui.button('B')
     """
 
+    width: int = 1
+    height: int = 1
+
     def __init__(self, *, width: int = 1, height: int = 1) -> None:
         """Create a space.
 
@@ -59,13 +69,12 @@ class Space(Element):
             width: Width in characters
             height: Height in rows
         """
-        super().__init__()
-        self.tag = "space"
-        self.width = width
-        self.height = height
-
+        super().__init__(tag="space")
+        if width != 1:
+            self.width = width
+        if height != 1:
+            self.height = height
 
-class Divider(Separator):
-    """Alias for Separator (alternative naming)."""
 
-    pass
+# Alias for Separator (alternative naming)
+Divider = Separator
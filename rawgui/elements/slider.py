@@ -67,9 +67,7 @@ class Slider(DisableableElement, Element):
         self._value = max(self.min, min(self.max, self._value))
 
         if old_value != self._value:
-            self._fire_event("change", self._value)
-            if self._on_change:
-                self._on_change(self._value)
+            self._fire_change(self._value)
 
     @property
     def percentage(self) -> float:
@@ -148,6 +146,4 @@ class Knob(Element):
         self._value = val
 
         if old_value != self._value:
-            self._fire_event("change", self._value)
-            if self._on_change:
-                self._on_change(self._value)
+            self._fire_change(self._value)
@@ -136,7 +136,7 @@ class Table(Element):
             if row_key not in self._selected:
                 self._selected.append(row_key)
 
-        if self._on_select:
+        if self._on_select is not None:
             self._on_select(self.selected)
 
     def deselect(self, row_key: Any) -> None:
@@ -144,7 +144,7 @@ class Table(Element):
         if row_key in self._selected:
             self._selected.remove(row_key)
 
-        if self._on_select:
+        if self._on_select is not None:
             self._on_select(self.selected)
 
     def toggle_select(self, row_key: Any) -> None:
@@ -157,14 +157,14 @@ class Table(Element):
     def clear_selection(self) -> None:
         """Clear all selections."""
         self._selected = []
-        if self._on_select:
+        if self._on_select is not None:
             self._on_select([])
 
     def select_all(self) -> None:
         """Select all rows (multiple selection only)."""
         if self.selection == "multiple":
             self._selected = [r.get(self.row_key) for r in self._rows]
-            if self._on_select:
+            if self._on_select is not None:
                 self._on_select(self.selected)
 
     def sort(self, column: str, ascending: bool = True) -> None:
@@ -98,9 +98,7 @@ class Tabs(Element):
         old_value = self._value
         self._value = val
         if old_value != val:
-            self._fire_event("change", val)
-            if self._on_change:
-                self._on_change(val)
+            self._fire_change(val)
 
     def __enter__(self) -> "Tabs":
         """Enter context."""
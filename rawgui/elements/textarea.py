@@ -64,9 +64,7 @@ class Textarea(DisableableElement, Element):
         old_value = self._value
         self._value = val
         if old_value != val:
-            self._fire_event("change", val)
-            if self._on_change:
-                self._on_change(val)
+            self._fire_change(val)
 
     @property
     def lines(self) -> list[str]:
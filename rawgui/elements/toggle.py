@@ -56,27 +56,23 @@ class Toggle(DisableableElement, Element):
         old_value = self._value
         self._value = val
         if old_value != val:
-            self._fire_event("change", val)
-            if self._on_change:
-                self._on_change(val)
+            self._fire_change(val)
 
     def toggle(self) -> None:
         """Toggle the switch."""
-        if self.enabled:
+        if self._enabled:
             self.value = not self._value
 
     def on(self) -> None:
         """Turn on."""
-        if self.enabled:
+        if self._enabled:
             self.value = True
 
     def off(self) -> None:
         """Turn off."""
-        if self.enabled:
+        if self._enabled:
             self.value = False
 
 
-class Switch(Toggle):
-    """Alias for Toggle (NiceGUI compatibility)."""
-
-    pass
+# Alias for Toggle (NiceGUI compatibility)
+Switch = Toggle
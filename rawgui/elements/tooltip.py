@@ -119,7 +119,7 @@ class Chip(Element):
         self.color = color
         self.removable = removable
 
-        if on_click:
+        if on_click is not None:
             self.on("click", on_click)
 
     def remove(self) -> None:
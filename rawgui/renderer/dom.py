@@ -345,11 +345,11 @@ class DOMBuilder:
             box.content_height = 2 * CHAR_HEIGHT_PX  # content + spacing
 
         elif element.tag == "radio":
-            options = getattr(element, "_options", [])
+            labels = getattr(element, "_labels", ())
             # Radio: one row per option
-            max_label = max((len(opt.get("label", "")) for opt in options), default=0)
+            max_label = max(map(len, labels), default=0)
             box.content_width = (max_label + 5) * CHAR_WIDTH_PX  # "(*) " + label
-            box.content_height = len(options) * CHAR_HEIGHT_PX
+            box.content_height = len(labels) * CHAR_HEIGHT_PX
 
         elif element.tag == "select":
             label = getattr(element, "label", "") or ""
@@ -300,12 +300,29 @@ CSS_PROPERTIES: Dict[str, str] = {
 }
 
 
+# Box sides set by each direction suffix of the padding/margin classes
+# (None: p-{n}/m-{n}, "a": q-pa-{size}/q-ma-{size})
+_SIDES: Dict[Optional[str], Tuple[str, ...]] = {
+    None: ("top", "right", "bottom", "left"),
+    "a": ("top", "right", "bottom", "left"),
+    "x": ("left", "right"),
+    "y": ("top", "bottom"),
+    "t": ("top",),
+    "r": ("right",),
+    "b": ("bottom",),
+    "l": ("left",),
+}
+
+
 class StyleMapper:
     """Maps CSS classes and styles to terminal attributes.
 
     Uses data-driven definitions for maintainability and extensibility.
     """
 
+    # Resolved class names kept before the cache is emptied
+    CLASS_CACHE_SIZE = 512
+
     def __init__(self) -> None:
         """Initialize the style mapper with compiled patterns."""
         self._compiled_patterns = [
@@ -315,6 +332,8 @@ class StyleMapper:
             }
             for p in CLASS_PATTERNS
         ]
+        # The same class names are mapped for every element on every frame
+        self._class_cache: Dict[str, Tuple[Tuple[str, Any], ...]] = {}
 
     def map_classes(self, classes: List[str]) -> TerminalStyle:
         """Map a list of CSS classes to terminal style.
@@ -327,186 +346,106 @@ class StyleMapper:
         """
         style = TerminalStyle()
 
+        cache = self._class_cache
         for cls in classes:
-            # Check static class definitions first
-            if cls in STATIC_CLASSES:
-                for attr, value in STATIC_CLASSES[cls].items():
-                    setattr(style, attr, value)
-                continue
-
-            # Try pattern-based matching
-            matched = False
-            for pattern_def in self._compiled_patterns:
-                match = pattern_def["regex"].match(cls)
-                if match:
-                    # Check exclusions
-                    if "exclude" in pattern_def:
-                        groups = match.groups()
-                        if groups and groups[0] in pattern_def["exclude"]:
-                            continue
-
-                    handler = getattr(self, f"_handle_{pattern_def['handler']}", None)
-                    if handler:
-                        handler(style, match)
-                        matched = True
-                        break
-
-            if matched:
-                continue
+            updates = cache.get(cls)
+            if updates is None:
+                if len(cache) >= self.CLASS_CACHE_SIZE:
+                    cache.clear()
+                updates = cache[cls] = self._parse_class(cls)
+            for attr, value in updates:
+                setattr(style, attr, value)
 
         return style
 
-    def _handle_text_color(self, style: TerminalStyle, match: re.Match) -> None:
-        """Handle text-{color}-{shade} pattern."""
-        color_name = match.group(1)
-        shade = match.group(2)
-
-        if color_name not in COLOR_MAP:
-            return
+    def _parse_class(self, cls: str) -> Tuple[Tuple[str, Any], ...]:
+        """Resolve a class name to the style attributes it sets.
 
-        terminal_color = COLOR_MAP[color_name]
-
-        # Apply brightness based on shade
-        if shade and shade in SHADE_BRIGHTNESS:
-            if SHADE_BRIGHTNESS[shade] and not terminal_color.startswith("bright_"):
-                terminal_color = f"bright_{terminal_color}"
+        Args:
+            cls: Class name
 
-        style.fg_color = terminal_color
+        Returns:
+            (attribute, value) pairs in the order they are applied
+        """
+        # Check static class definitions first
+        if cls in STATIC_CLASSES:
+            return tuple(STATIC_CLASSES[cls].items())
+
+        # Try pattern-based matching
+        for pattern_def in self._compiled_patterns:
+            match = pattern_def["regex"].match(cls)
+            if match:
+                # Check exclusions
+                if "exclude" in pattern_def:
+                    groups = match.groups()
+                    if groups and groups[0] in pattern_def["exclude"]:
+                        continue
+
+                handler = getattr(self, f"_handle_{pattern_def['handler']}", None)
+                if handler:
+                    return tuple(handler(match).items())
+
+        return ()
+
+    def _handle_text_color(self, match: re.Match) -> Dict[str, Any]:
+        """Handle text-{color}-{shade} pattern."""
+        color = self._shaded_color(match.group(1), match.group(2))
+        return {"fg_color": color} if color else {}
 
-    def _handle_bg_color(self, style: TerminalStyle, match: re.Match) -> None:
+    def _handle_bg_color(self, match: re.Match) -> Dict[str, Any]:
         """Handle bg-{color}-{shade} pattern."""
-        color_name = match.group(1)
-        shade = match.group(2)
+        color = self._shaded_color(match.group(1), match.group(2))
+        return {"bg_color": color} if color else {}
 
+    @staticmethod
+    def _shaded_color(color_name: str, shade: Optional[str]) -> Optional[str]:
+        """Map a Tailwind color and shade to a terminal color name."""
         if color_name not in COLOR_MAP:
-            return
+            return None
 
         terminal_color = COLOR_MAP[color_name]
 
-        if shade and shade in SHADE_BRIGHTNESS:
-            if SHADE_BRIGHTNESS[shade] and not terminal_color.startswith("bright_"):
-                terminal_color = f"bright_{terminal_color}"
-
-        style.bg_color = terminal_color
+        # Apply brightness based on shade
+        if shade and SHADE_BRIGHTNESS.get(shade) and not terminal_color.startswith("bright_"):
+            terminal_color = f"bright_{terminal_color}"
+        return terminal_color
 
-    def _handle_padding(self, style: TerminalStyle, match: re.Match) -> None:
+    def _handle_padding(self, match: re.Match) -> Dict[str, Any]:
         """Handle p-{n}, px-{n}, py-{n}, pt-{n}, etc."""
         direction = match.group(1)  # x, y, t, r, b, l, or None
         value = int(match.group(2))
+        return {f"padding_{side}": value for side in _SIDES[direction]}
 
-        if direction is None:
-            # p-{n} - all sides
-            style.padding_top = value
-            style.padding_right = value
-            style.padding_bottom = value
-            style.padding_left = value
-        elif direction == "x":
-            style.padding_left = value
-            style.padding_right = value
-        elif direction == "y":
-            style.padding_top = value
-            style.padding_bottom = value
-        elif direction == "t":
-            style.padding_top = value
-        elif direction == "r":
-            style.padding_right = value
-        elif direction == "b":
-            style.padding_bottom = value
-        elif direction == "l":
-            style.padding_left = value
-
-    def _handle_margin(self, style: TerminalStyle, match: re.Match) -> None:
+    def _handle_margin(self, match: re.Match) -> Dict[str, Any]:
         """Handle m-{n}, mx-{n}, my-{n}, mt-{n}, etc."""
         direction = match.group(1)
         value = int(match.group(2))
+        return {f"margin_{side}": value for side in _SIDES[direction]}
 
-        if direction is None:
-            style.margin_top = value
-            style.margin_right = value
-            style.margin_bottom = value
-            style.margin_left = value
-        elif direction == "x":
-            style.margin_left = value
-            style.margin_right = value
-        elif direction == "y":
-            style.margin_top = value
-            style.margin_bottom = value
-        elif direction == "t":
-            style.margin_top = value
-        elif direction == "r":
-            style.margin_right = value
-        elif direction == "b":
-            style.margin_bottom = value
-        elif direction == "l":
-            style.margin_left = value
-
-    def _handle_gap(self, style: TerminalStyle, match: re.Match) -> None:
+    def _handle_gap(self, match: re.Match) -> Dict[str, Any]:
         """Handle gap-{n} pattern."""
         # direction = match.group(1)  # x, y, or None (not used yet)
-        value = int(match.group(2))
-        style.gap = value
+        return {"gap": int(match.group(2))}
 
-    def _handle_width(self, style: TerminalStyle, match: re.Match) -> None:
+    def _handle_width(self, match: re.Match) -> Dict[str, Any]:
         """Handle w-{n} pattern."""
-        style.width = int(match.group(1))
+        return {"width": int(match.group(1))}
 
-    def _handle_height(self, style: TerminalStyle, match: re.Match) -> None:
+    def _handle_height(self, match: re.Match) -> Dict[str, Any]:
         """Handle h-{n} pattern."""
-        style.height = int(match.group(1))
+        return {"height": int(match.group(1))}
 
-    def _handle_quasar_padding(self, style: TerminalStyle, match: re.Match) -> None:
+    def _handle_quasar_padding(self, match: re.Match) -> Dict[str, Any]:
         """Handle q-pa-{size}, q-px-{size}, etc."""
         direction = match.group(1)  # a, x, y, t, r, b, l
-        size_name = match.group(2)
-
-        value = QUASAR_SIZES.get(size_name, 0)
-
-        if direction == "a":  # all
-            style.padding_top = value
-            style.padding_right = value
-            style.padding_bottom = value
-            style.padding_left = value
-        elif direction == "x":
-            style.padding_left = value
-            style.padding_right = value
-        elif direction == "y":
-            style.padding_top = value
-            style.padding_bottom = value
-        elif direction == "t":
-            style.padding_top = value
-        elif direction == "r":
-            style.padding_right = value
-        elif direction == "b":
-            style.padding_bottom = value
-        elif direction == "l":
-            style.padding_left = value
-
-    def _handle_quasar_margin(self, style: TerminalStyle, match: re.Match) -> None:
+        value = QUASAR_SIZES.get(match.group(2), 0)
+        return {f"padding_{side}": value for side in _SIDES[direction]}
+
+    def _handle_quasar_margin(self, match: re.Match) -> Dict[str, Any]:
         """Handle q-ma-{size}, q-mx-{size}, etc."""
         direction = match.group(1)
-        size_name = match.group(2)
-
-        value = QUASAR_SIZES.get(size_name, 0)
-
-        if direction == "a":
-            style.margin_top = value
-            style.margin_right = value
-            style.margin_bottom = value
-            style.margin_left = value
-        elif direction == "x":
-            style.margin_left = value
-            style.margin_right = value
-        elif direction == "y":
-            style.margin_top = value
-            style.margin_bottom = value
-        elif direction == "t":
-            style.margin_top = value
-        elif direction == "r":
-            style.margin_right = value
-        elif direction == "b":
-            style.margin_bottom = value
-        elif direction == "l":
-            style.margin_left = value
+        value = QUASAR_SIZES.get(match.group(2), 0)
+        return {f"margin_{side}": value for side in _SIDES[direction]}
 
     def map_inline_style(self, style_dict: Dict[str, str]) -> TerminalStyle:
         """Map inline CSS styles to terminal style.
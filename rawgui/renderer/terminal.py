@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from blessed import Terminal
+from blessed.formatters import FormattingString
 
 from ..constants import (
     CHAR_WIDTH_PX,
@@ -43,6 +44,23 @@ class TerminalRenderer:
     # Tags that render as overlays with shadows
     OVERLAY_TAGS = ("dialog", "menu", "context_menu", "notification")
 
+    # Tags with element-specific content in _render_element_content
+    CONTENT_TAGS = frozenset((
+        "label", "button", "input", "checkbox", "toggle", "radio", "select",
+        "progress", "spinner", "slider", "separator", "link", "badge", "icon",
+        "textarea", "number", "tabs", "table", "tree",
+    ))
+
+    # Tags that can receive focus (when enabled and visible)
+    FOCUSABLE_TAGS = frozenset((
+        "button", "input", "checkbox", "select", "radio", "slider", "toggle",
+        "textarea", "number",
+    ))
+
+    # Checkbox prefixes ("[x] text" / "[ ] text")
+    _CHK_ON = "[x] "
+    _CHK_OFF = "[ ] "
+
     def __init__(self) -> None:
         """Initialize the renderer."""
         self.term = Terminal()
@@ -56,9 +74,13 @@ class TerminalRenderer:
         # DOM tree
         self._root_node: Optional[DOMNode] = None
 
+        # Style escape prefixes by (reverse, bold, underline, fg, bg)
+        self._style_prefixes: Dict[Tuple[bool, bool, bool, Optional[str], Optional[str]], str] = {}
+
         # Element tracking
         self._node_map: Dict[int, DOMNode] = {}  # element.id -> DOMNode
         self._focusable: List["Element"] = []
+        self._focus_positions: Dict[int, int] = {}  # element.id -> index in _focusable
         self._focus_index: int = -1
         self._focused: Optional["Element"] = None
         self._hovered: Optional["Element"] = None
@@ -78,6 +100,9 @@ class TerminalRenderer:
         # Layer compositor for overlay rendering
         self._compositor: Optional[LayerCompositor] = None
 
+        # (width, cells per row) of the last frame, for render_changes()
+        self._last_frame: Optional[Tuple[int, List[List[str]]]] = None
+
         # Running state
         self._dirty = True
 
@@ -110,10 +135,91 @@ class TerminalRenderer:
         Returns:
             Rendered terminal output as string
         """
+        rows = self._render_cells(root)
+        self._last_frame = (self.width, rows)
+        self._dirty = False
+        return self.term.home + self.term.clear + "\n".join("".join(row) for row in rows)
+
+    def render_changes(self, root: "Element") -> str:
+        """Render the tree and return output rewriting only changed cells.
+
+        The first frame, and any frame after a resize, is written in full
+        like :meth:`render`. After that each changed row is rewritten from
+        its first to its last changed cell behind a single cursor move, so
+        moving focus only rewrites the two affected widgets instead of the
+        whole screen.
+
+        Args:
+            root: Root element to render
+
+        Returns:
+            Terminal output that brings the previous frame up to date
+            (empty if nothing changed)
+        """
+        previous = self._last_frame
+        rows = self._render_cells(root)
+        self._last_frame = (self.width, rows)
+        self._dirty = False
+
+        if previous is None or previous[0] != self.width or len(previous[1]) != len(rows):
+            return self.term.home + self.term.clear + "\n".join("".join(row) for row in rows)
+
+        move_yx = self.term.move_yx
+        parts: List[str] = []
+        for y, (old, new) in enumerate(zip(previous[1], rows)):
+            if old == new:
+                continue
+            start, end = 0, len(new)
+            if len(old) == end:
+                # Trim the unchanged cells at both ends of the row
+                while old[start] == new[start]:
+                    start += 1
+                while old[end - 1] == new[end - 1]:
+                    end -= 1
+            parts.append(move_yx(y, start))
+            parts.extend(new[start:end])
+        return "".join(parts)
+
+    def _render_cells(self, root: "Element") -> List[List[str]]:
+        """Render the tree to one output fragment per screen cell.
+
+        Styled fragments end with the terminal's normal sequence, so any
+        run of cells can be written on its own after a cursor move.
+        """
+        compositor = self.build_layers(root)
+
+        # Composite all layers
+        composite = compositor.composite()
+
+        # Convert composite cells to (styled) strings
+        apply_style = self._apply_style
+        return [
+            [
+                apply_style(cell.char or " ", cell.style) if cell.style else (cell.char or " ")
+                for cell in composite[y][:self.width]
+            ]
+            for y in range(self.height)
+        ]
+
+    def build_layers(self, root: "Element") -> LayerCompositor:
+        """Lay out the tree and fill the compositor layers without output.
+
+        Runs everything :meth:`render` does except compositing and building
+        the terminal string, for callers that only need layout, focus or
+        overlay state.
+
+        Args:
+            root: Root element to render
+
+        Returns:
+            The compositor holding the base layer and one layer per
+            visible overlay
+        """
         self._screen_width_px = self.width_px
         self._screen_height_px = self.height_px
         self._node_map.clear()
         self._focusable.clear()
+        self._focus_positions.clear()
 
         # Build DOM tree with pixel-based layout
         self._root_node = self.dom_builder.build(
@@ -134,6 +240,21 @@ class TerminalRenderer:
             # Mark the node as focused
             if self._focused and self._focused.id in self._node_map:
                 self._node_map[self._focused.id].focused = True
+        elif self._focused is not None and self._focused.id not in self._focus_positions:
+            # The focused element left the tree (e.g. the page was replaced)
+            # or can no longer take focus: move focus to the element now at
+            # its position, so the old element (and its page) is not kept alive.
+            # Edit mode belonged to the old element, so it ends here too.
+            self._edit_mode = False
+            if self._focusable:
+                self._focus_index = max(0, min(self._focus_index, len(self._focusable) - 1))
+                self._focused = self._focusable[self._focus_index]
+                self._node_map[self._focused.id].focused = True
+            else:
+                self._focus_index = -1
+                self._focused = None
+        if self._hovered is not None and self._hovered.id not in self._node_map:
+            self._hovered = None
 
         # Track content size
         self._content_width = self._root_node.box.border_box_width
@@ -153,9 +274,10 @@ class TerminalRenderer:
                 self._compositor.remove_layer(name)
         self._compositor.invalidate()
 
-        # Build base buffer
-        base_buffer = [[' ' for _ in range(self.width)] for _ in range(self.height)]
-        base_style_buffer = [[None for _ in range(self.width)] for _ in range(self.height)]
+        # Build base buffer (rows preallocated by repetition; cells hold
+        # immutable values, so sharing them within a row is safe)
+        base_buffer = [[' '] * self.width for _ in range(self.height)]
+        base_style_buffer = [[None] * self.width for _ in range(self.height)]
 
         # Render DOM to base buffer (excluding overlays)
         self._render_node(self._root_node, 0, 0, base_buffer, base_style_buffer, skip_overlays=True)
@@ -196,8 +318,8 @@ class TerminalRenderer:
             )
 
             # Render overlay content to a temp buffer
-            overlay_buffer = [['\x00' for _ in range(layer.width)] for _ in range(layer.height)]
-            overlay_style_buffer = [[None for _ in range(layer.width)] for _ in range(layer.height)]
+            overlay_buffer = [['\x00'] * layer.width for _ in range(layer.height)]
+            overlay_style_buffer = [[None] * layer.width for _ in range(layer.height)]
 
             # Render the overlay node
             self._render_overlay_node(overlay_node, 0, 0, overlay_buffer, overlay_style_buffer)
@@ -210,44 +332,12 @@ class TerminalRenderer:
                     if char != '\x00':
                         layer.set_cell(x, y, char, style)
 
-        # Composite all layers
-        composite = self._compositor.composite()
-
-        # Convert composite to string with styles
-        output = self.term.home + self.term.clear
-        lines = []
-
-        for y in range(self.height):
-            line = ""
-            current_style = None
-            for x in range(self.width):
-                cell = composite[y][x]
-                char = cell.char if cell.char else " "
-                style = cell.style
-
-                if style != current_style:
-                    if current_style is not None:
-                        line += self.term.normal
-                    current_style = style
-
-                if style:
-                    line += self._apply_style(char, style)
-                else:
-                    line += char
-
-            if current_style:
-                line += self.term.normal
-            lines.append(line)
-
-        output += "\n".join(lines)
-
         # Update focus if needed (initial focus)
         if self._focusable and self._focus_index < 0:
             self._focus_index = 0
             self._focused = self._focusable[0]
 
-        self._dirty = False
-        return output
+        return self._compositor
 
     def _find_overlays(self, element: "Element") -> List["Element"]:
         """Find all overlay elements (dialogs, menus, etc.) in the tree."""
@@ -331,6 +421,7 @@ class TerminalRenderer:
 
             # Track focusable elements
             if self._is_focusable(node.element):
+                self._focus_positions[node.element.id] = len(self._focusable)
                 self._focusable.append(node.element)
 
                 # Update focus state
@@ -439,13 +530,18 @@ class TerminalRenderer:
         if not element:
             return
 
-        if element.tag == "label":
+        # Containers have no content of their own; skip the dispatch chain
+        tag = element.tag
+        if tag not in self.CONTENT_TAGS:
+            return
+
+        if tag == "label":
             text = getattr(element, "text", "") or ""
             lines = text.split("\n")
             for i, line in enumerate(lines):
                 self._draw_text(buffer, style_buffer, content_x, content_y + i, line, style)
 
-        elif element.tag == "button":
+        elif tag == "button":
             text = getattr(element, "text", "") or ""
             enabled = getattr(element, "enabled", True)
 
@@ -465,7 +561,7 @@ class TerminalRenderer:
             btn_text = f"[ {text} ]"
             self._draw_text(buffer, style_buffer, content_x, btn_y, btn_text, btn_style)
 
-        elif element.tag == "input":
+        elif tag == "input":
             label = getattr(element, "label", "") or ""
             value = getattr(element, "value", "") or ""
             placeholder = getattr(element, "placeholder", "") or ""
@@ -532,14 +628,11 @@ class TerminalRenderer:
                 char_at_cursor = display[cursor_pos] if cursor_pos < len(display) else " "
                 self._draw_text(buffer, style_buffer, cursor_x, y, char_at_cursor, cursor_style)
 
-        elif element.tag == "checkbox":
+        elif tag == "checkbox":
             text = getattr(element, "text", "") or ""
             value = getattr(element, "value", False)
             enabled = getattr(element, "enabled", True)
 
-            # Checkbox: [x] text or [ ] text
-            check_char = "x" if value else " "
-
             # Style based on state:
             # - Disabled: dim
             # - Highlighted (nav focus): cyan bg (checkboxes don't have edit mode)
@@ -553,10 +646,10 @@ class TerminalRenderer:
 
             # Draw after spacing row (0.5 top + 0.5 bottom effect)
             cb_y = content_y + 1
-            checkbox_text = f"[{check_char}] {text}"
+            checkbox_text = (self._CHK_ON if value else self._CHK_OFF) + text
             self._draw_text(buffer, style_buffer, content_x, cb_y, checkbox_text, checkbox_style)
 
-        elif element.tag == "toggle":
+        elif tag == "toggle":
             text = getattr(element, "text", "") or ""
             value = getattr(element, "value", False)
             enabled = getattr(element, "enabled", True)
@@ -573,8 +666,9 @@ class TerminalRenderer:
             toggle_text = f"({toggle_char}) {text}" if text else f"({toggle_char}) {state_text}"
             self._draw_text(buffer, style_buffer, content_x, toggle_y, toggle_text, toggle_style)
 
-        elif element.tag == "radio":
-            options = getattr(element, "_options", [])
+        elif tag == "radio":
+            values = getattr(element, "_values", ())
+            labels = getattr(element, "_labels", ())
             value = getattr(element, "_value", None)
             enabled = getattr(element, "enabled", True)
 
@@ -583,14 +677,12 @@ class TerminalRenderer:
                 radio_style = TerminalStyle(fg_color="bright_black")
 
             y_offset = 0
-            for opt in options:
-                selected = opt.get("value") == value
-                marker = "(*)" if selected else "( )"
-                label = opt.get("label", str(opt.get("value", "")))
+            for opt_value, label in zip(values, labels):
+                marker = "(*)" if opt_value == value else "( )"
                 self._draw_text(buffer, style_buffer, content_x, content_y + y_offset, f"{marker} {label}", radio_style)
                 y_offset += 1
 
-        elif element.tag == "select":
+        elif tag == "select":
             label = getattr(element, "label", "") or ""
             display = getattr(element, "display_value", "") or ""
             enabled = getattr(element, "enabled", True)
@@ -610,7 +702,7 @@ class TerminalRenderer:
             dropdown_text = f"[{display:15}] {arrow}"
             self._draw_text(buffer, style_buffer, x, content_y, dropdown_text, select_style)
 
-        elif element.tag == "progress":
+        elif tag == "progress":
             value = getattr(element, "_value", 0.0) or 0.0
             show_value = getattr(element, "show_value", False)
 
@@ -623,7 +715,7 @@ class TerminalRenderer:
                 progress_text += f" {int(value * 100)}%"
             self._draw_text(buffer, style_buffer, content_x, content_y, progress_text, style)
 
-        elif element.tag == "spinner":
+        elif tag == "spinner":
             value = getattr(element, "_value", None)
             current_frame = getattr(element, "current_frame", "|")
 
@@ -635,7 +727,7 @@ class TerminalRenderer:
                 progress_text = f"[{current_frame}]"
             self._draw_text(buffer, style_buffer, content_x, content_y, progress_text, style)
 
-        elif element.tag == "slider":
+        elif tag == "slider":
             value = getattr(element, "_value", 0.0) or 0.0
             min_val = getattr(element, "min", 0.0)
             max_val = getattr(element, "max", 1.0)
@@ -659,7 +751,7 @@ class TerminalRenderer:
             slider_text = f"[{track}] {value:.2f}"
             self._draw_text(buffer, style_buffer, content_x, content_y, slider_text, slider_style)
 
-        elif element.tag == "separator":
+        elif tag == "separator":
             vertical = getattr(element, "vertical", False)
             char = getattr(element, "char", "-" if not vertical else "|")
             width_cols = node.box.content_cols if not vertical else 1
@@ -669,21 +761,21 @@ class TerminalRenderer:
                 for col_off in range(width_cols):
                     self._draw_text(buffer, style_buffer, content_x + col_off, content_y + row_off, char, style)
 
-        elif element.tag == "link":
+        elif tag == "link":
             text = getattr(element, "text", "") or ""
             link_style = TerminalStyle(underline=True, fg_color="blue")
             self._draw_text(buffer, style_buffer, content_x, content_y, text, link_style)
 
-        elif element.tag == "badge":
+        elif tag == "badge":
             text = getattr(element, "text", "") or ""
             badge_style = TerminalStyle(reverse=True)
             self._draw_text(buffer, style_buffer, content_x, content_y, f" {text} ", badge_style)
 
-        elif element.tag == "icon":
+        elif tag == "icon":
             icon_text = getattr(element, "text", "[?]") or "[?]"
             self._draw_text(buffer, style_buffer, content_x, content_y, icon_text, style)
 
-        elif element.tag == "textarea":
+        elif tag == "textarea":
             label = getattr(element, "label", "") or ""
             value = getattr(element, "_value", "") or ""
             placeholder = getattr(element, "placeholder", "") or ""
@@ -704,7 +796,7 @@ class TerminalRenderer:
             for i, line in enumerate(lines):
                 self._draw_text(buffer, style_buffer, content_x, y + i, f"|{line[:30]:30}|", ta_style)
 
-        elif element.tag == "number":
+        elif tag == "number":
             label = getattr(element, "label", "") or ""
             display = getattr(element, "display_value", "") or ""
             enabled = getattr(element, "enabled", True)
@@ -720,7 +812,7 @@ class TerminalRenderer:
 
             self._draw_text(buffer, style_buffer, x, content_y, f"[{display:10}]", num_style)
 
-        elif element.tag == "tabs":
+        elif tag == "tabs":
             # Render tab headers
             x = content_x
             for child in element.children:
@@ -733,7 +825,7 @@ class TerminalRenderer:
                     self._draw_text(buffer, style_buffer, x, content_y, f" {tab_label} ", tab_style)
                     x += len(tab_label) + 3
 
-        elif element.tag == "table":
+        elif tag == "table":
             columns = getattr(element, "_columns", [])
             visible_rows = getattr(element, "visible_rows", [])
             title = getattr(element, "title", None)
@@ -765,7 +857,7 @@ class TerminalRenderer:
                     x += col_width + 1
                 y += 1
 
-        elif element.tag == "tree":
+        elif tag == "tree":
             nodes = getattr(element, "_nodes", [])
             expanded = getattr(element, "_expanded", set())
             selected = getattr(element, "_selected", None)
@@ -872,35 +964,41 @@ class TerminalRenderer:
 
     def _apply_style(self, char: str, style: TerminalStyle) -> str:
         """Apply terminal style to a character."""
-        result = char
-
+        key = (style.reverse, style.bold, style.underline, style.fg_color, style.bg_color)
+        prefix = self._style_prefixes.get(key)
+        if prefix is None:
+            prefix = self._style_prefixes[key] = self._style_prefix(style)
+        if not prefix:
+            return char
+        return "".join((prefix, char, self.term.normal))
+
+    def _style_prefix(self, style: TerminalStyle) -> str:
+        """Build the escape sequences that switch the terminal to a style."""
+        names = []
         if style.reverse:
-            result = self.term.reverse(result)
+            names.append("reverse")
         if style.bold:
-            result = self.term.bold(result)
+            names.append("bold")
         if style.underline:
-            result = self.term.underline(result)
-
+            names.append("underline")
         if style.fg_color:
-            color_func = getattr(self.term, style.fg_color, None)
-            if color_func and callable(color_func):
-                result = color_func(result)
-
+            names.append(style.fg_color)
         if style.bg_color:
-            color_func = getattr(self.term, f"on_{style.bg_color}", None)
-            if color_func and callable(color_func):
-                result = color_func(result)
+            names.append(f"on_{style.bg_color}")
 
-        return result
+        sequences = []
+        for name in names:
+            sequence = getattr(self.term, name, None)
+            # Skip unknown names and capabilities that take parameters
+            if isinstance(sequence, FormattingString):
+                sequences.append(sequence)
+        return "".join(sequences)
 
     def _is_focusable(self, element: Optional["Element"]) -> bool:
         """Check if element can receive focus."""
-        if not element:
+        if not element or element.tag not in self.FOCUSABLE_TAGS:
             return False
-        focusable_tags = ("button", "input", "checkbox", "select", "radio", "slider", "toggle", "textarea", "number")
-        if element.tag in focusable_tags:
-            return getattr(element, "enabled", True) and element.visible
-        return False
+        return getattr(element, "enabled", True) and element.visible
 
     def get_element_at(self, x: int, y: int) -> Optional["Element"]:
         """Get element at screen coordinates (ASCII)."""
@@ -962,8 +1060,9 @@ class TerminalRenderer:
 
     def focus_element(self, element: "Element") -> None:
         """Focus a specific element."""
-        if element in self._focusable:
-            self._focus_index = self._focusable.index(element)
+        index = self._focus_positions.get(element.id)
+        if index is not None:
+            self._focus_index = index
             self._focused = element
             self._dirty = True
 
@@ -1041,3 +1140,29 @@ class TerminalRenderer:
     def invalidate(self) -> None:
         """Mark renderer as needing re-render."""
         self._dirty = True
+
+    def reset(self) -> None:
+        """Clear tree, focus and scroll state so the renderer can be reused.
+
+        The terminal, style mapper and compositor are kept; overlay layers
+        are dropped.
+        """
+        self._root_node = None
+        self._node_map.clear()
+        self._focusable.clear()
+        self._focus_positions.clear()
+        self._focus_index = -1
+        self._focused = None
+        self._hovered = None
+        self._edit_mode = False
+        self._pending_focus_index = None
+        self._scroll_x = 0
+        self._scroll_y = 0
+        self._content_width = 0
+        self._content_height = 0
+        self._last_frame = None
+        if self._compositor is not None:
+            for name in list(self._compositor._layers.keys()):
+                if name != "base":
+                    self._compositor.remove_layer(name)
+        self._dirty = True
@@ -16,17 +16,16 @@ import traceback
 from pathlib import Path
 from typing import Callable, List, Optional, TYPE_CHECKING
 
-from blessed import Terminal
-
 from .app import App, app
 from .client import Client
 from .context import context
 from .element import Element
 from .page import router
-from .renderer.terminal import TerminalRenderer
 
 if TYPE_CHECKING:
-    pass
+    from blessed import Terminal
+
+    from .renderer.terminal import TerminalRenderer
 
 
 class RawGUIApp:
@@ -50,8 +49,14 @@ class RawGUIApp:
         self.reload = reload
         self.dark = dark
 
-        self.term = Terminal()
-        self.renderer = TerminalRenderer()
+        # blessed and the renderer are only needed once an app actually runs,
+        # so importing rawgui.ui stays cheap
+        from blessed import Terminal
+
+        from .renderer.terminal import TerminalRenderer
+
+        self.term: Terminal = Terminal()
+        self.renderer: TerminalRenderer = TerminalRenderer()
         self.client: Optional[Client] = None
 
         self._running = False
@@ -103,7 +108,7 @@ class RawGUIApp:
                 while self._running:
                     # Render if needed
                     if self.renderer.needs_render and self._root_element:
-                        output = self.renderer.render(self._root_element)
+                        output = self.renderer.render_changes(self._root_element)
                         print(output, end="", flush=True)
 
                     # Handle input with timeout
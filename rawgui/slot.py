@@ -27,6 +27,9 @@ class Slot:
             ui.button('Click') # Added as child of row
     """
 
+    # One slot per element is created, so skip the per-instance __dict__
+    __slots__ = ("parent", "name", "children")
+
     def __init__(self, parent: "Element", name: str = "default") -> None:
         """Initialize a slot.
 
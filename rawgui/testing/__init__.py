@@ -2,11 +2,13 @@
 
 Provides tools for testing TUI applications including:
 - SubprocessTerminal: PTY-based testing similar to Selenium
+- AppRunner: forks apps from a pre-warmed interpreter for fast PTY tests
 - Screenshot capture for all renderers (TUI, PIL, NiceGUI, Tkinter with Xvfb)
 - User: Selenium-like API for simulating user interactions
 """
 
 from .subprocess_terminal import SubprocessTerminal, run_terminal_test
+from .app_runner import AppRunner
 from .screenshots import capture_tui, capture_pil, capture_nicegui, capture_all_renderers
 from .screenshot_xvfb import capture_tkinter_xvfb
 from .user import User, TUIUser, TkinterUser, ElementInfo, compare_images
@@ -14,6 +16,7 @@ from .user import User, TUIUser, TkinterUser, ElementInfo, compare_images
 __all__ = [
     "SubprocessTerminal",
     "run_terminal_test",
+    "AppRunner",
     "capture_tui",
     "capture_pil",
     "capture_nicegui",
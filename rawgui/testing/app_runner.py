@@ -0,0 +1,336 @@
+"""Pre-warmed app runner for terminal tests.
+
+Starting a fresh interpreter and importing rawgui for every terminal test
+dominates the runtime of subprocess-based suites. AppRunner starts one
+server process that imports rawgui once and then forks a child in a new
+PTY for each app. The PTY master is handed back over a Unix socket, so
+the test drives the app exactly like a SubprocessTerminal.
+
+Usage:
+    with AppRunner() as runner:
+        with runner.run("app.py", rows=24, cols=80) as term:
+            term.wait_for_text("Hello")
+            term.screenshot("output.png")
+        with runner.run(script="from rawgui import ui; ...") as term:
+            ...
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from types import CodeType
+from typing import Dict, Optional, Tuple
+
+from pexpect import fdpexpect
+
+from .subprocess_terminal import SubprocessTerminal
+
+
+# Entry point of the server process (not ``-m``: this module is already
+# imported by the rawgui.testing package, which runpy warns about)
+_SERVER_MAIN = (
+    "import sys; from rawgui.testing.app_runner import _serve; _serve(int(sys.argv[1]))"
+)
+
+
+class ForkedTerminal(SubprocessTerminal):
+    """A SubprocessTerminal whose app is forked from an AppRunner.
+
+    Created by :meth:`AppRunner.run`; all query, input and screenshot
+    methods behave like :class:`SubprocessTerminal`.
+    """
+
+    def __init__(
+        self,
+        runner: "AppRunner",
+        path: Optional[str | Path],
+        rows: int = 24,
+        cols: int = 80,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        script: Optional[str] = None,
+    ) -> None:
+        """Initialize the forked terminal.
+
+        Args:
+            runner: The runner that forks the app
+            path: Path of the app script to run (None when ``script`` is given)
+            rows: Terminal height in rows
+            cols: Terminal width in columns
+            cwd: Working directory for the app
+            env: Additional environment variables
+            script: App source to run instead of a file
+        """
+        command = str(path) if path is not None else "<script>"
+        super().__init__(
+            command, rows=rows, cols=cols, cwd=cwd, env=env, script=script
+        )
+        self._path = None if path is None else str(path)
+        self._runner = runner
+        self._pid: Optional[int] = None
+
+    def start(self, timeout: float = 10.0) -> None:
+        """Fork the app from the runner and attach to its PTY.
+
+        Args:
+            timeout: Default timeout for PTY reads
+        """
+        env = dict(self.env)
+        env["TERM"] = "xterm-256color"
+        self._pid, fd = self._runner._launch(
+            self._path, self.script, self.rows, self.cols, self.cwd, env
+        )
+        self._process = fdpexpect.fdspawn(fd, encoding="utf-8", timeout=timeout)
+
+        # Give it a moment to initialize (returns early once output arrives)
+        self.wait_ready(timeout=0.5)
+
+    def stop(self) -> None:
+        """Kill the app and close its PTY."""
+        if self._pid is not None:
+            try:
+                os.kill(self._pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            self._pid = None
+        if self._process:
+            self._process.close()
+            self._process = None
+
+
+class AppRunner:
+    """Runs terminal apps forked from one pre-warmed interpreter.
+
+    Requires ``os.fork`` and PTY support (Linux/macOS).
+    """
+
+    def __init__(self) -> None:
+        """Initialize the runner (the server starts on first use)."""
+        self._server: Optional[subprocess.Popen] = None
+        self._sock: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the server process if it is not running."""
+        if self._server is not None:
+            return
+        parent_sock, child_sock = socket.socketpair()
+        self._server = subprocess.Popen(
+            [sys.executable, "-c", _SERVER_MAIN, str(child_sock.fileno())],
+            pass_fds=(child_sock.fileno(),),
+        )
+        child_sock.close()
+        self._sock = parent_sock
+
+    def stop(self) -> None:
+        """Stop the server process. Apps already running are left alone."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        if self._server is not None:
+            try:
+                self._server.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                self._server.kill()
+                self._server.wait()
+            self._server = None
+
+    def run(
+        self,
+        path: Optional[str | Path] = None,
+        rows: int = 24,
+        cols: int = 80,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        script: Optional[str] = None,
+    ) -> ForkedTerminal:
+        """Create a terminal for an app script or app source.
+
+        The app is forked when the terminal is started, e.g. on entering
+        its ``with`` block.
+
+        Args:
+            path: Path of the app script (run as ``__main__``)
+            rows: Terminal height in rows
+            cols: Terminal width in columns
+            cwd: Working directory for the app
+            env: Additional environment variables
+            script: App source to run as ``__main__`` instead of ``path``;
+                it is sent to the server, so no file is written
+
+        Returns:
+            The (not yet started) terminal
+
+        Raises:
+            ValueError: If not exactly one of path and script is given
+        """
+        if (path is None) == (script is None):
+            raise ValueError("pass exactly one of path and script")
+        return ForkedTerminal(
+            self, path, rows=rows, cols=cols, cwd=cwd, env=env, script=script
+        )
+
+    def _launch(
+        self,
+        path: Optional[str],
+        script: Optional[str],
+        rows: int,
+        cols: int,
+        cwd: Optional[str],
+        env: Dict[str, str],
+    ) -> Tuple[int, int]:
+        """Ask the server to fork an app.
+
+        Returns:
+            Tuple of (child pid, PTY master file descriptor)
+        """
+        request = {
+            "path": path,
+            "script": script,
+            "rows": rows,
+            "cols": cols,
+            "cwd": cwd,
+            "env": env,
+        }
+        with self._lock:
+            self.start()
+            self._sock.sendall(json.dumps(request).encode() + b"\n")
+            msg, fds, _, _ = socket.recv_fds(self._sock, 1024, 1)
+        if not fds:
+            raise RuntimeError("App runner server exited")
+        return json.loads(msg)["pid"], fds[0]
+
+    def __enter__(self) -> "AppRunner":
+        """Context manager entry."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.stop()
+
+
+def _compile_app(
+    request: dict, cache: Dict[tuple, CodeType]
+) -> Tuple[str, Optional[CodeType]]:
+    """Compile the requested app in the server, reusing earlier results.
+
+    Code objects are inherited by every forked child, so each distinct
+    script (or unchanged file) is parsed and compiled only once.
+
+    Returns:
+        Tuple of (absolute path or "<app>", code object or None if the
+        source could not be read or compiled; the child then reports it)
+    """
+    if request["path"] is None:
+        filename = "<app>"
+        key = ("script", request["script"])
+    else:
+        filename = os.path.join(request["cwd"] or os.getcwd(), request["path"])
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return filename, None
+        key = ("path", filename, stat.st_mtime_ns, stat.st_size)
+
+    code = cache.get(key)
+    if code is None:
+        try:
+            if request["path"] is None:
+                source = request["script"]
+            else:
+                with open(filename, "rb") as f:
+                    source = f.read()
+            code = compile(source, filename, "exec")
+        except Exception:
+            return filename, None
+        cache[key] = code
+    return filename, code
+
+
+def _run_app(request: dict, filename: str, code: Optional[CodeType]) -> None:
+    """Run an app in a freshly forked child (never returns)."""
+    import fcntl
+    import struct
+    import termios
+    import traceback
+
+    status = 0
+    try:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        size = struct.pack("HHHH", request["rows"], request["cols"], 0, 0)
+        fcntl.ioctl(sys.stdout.fileno(), termios.TIOCSWINSZ, size)
+        if request["cwd"]:
+            os.chdir(request["cwd"])
+        os.environ.update(request["env"])
+        namespace = {"__name__": "__main__"}
+        if request["path"] is None:
+            sys.argv = ["-c"]
+            sys.path[0] = ""
+            if code is None:
+                code = compile(request["script"], filename, "exec")
+        else:
+            sys.argv = [filename]
+            sys.path[0] = os.path.dirname(filename)
+            namespace["__file__"] = filename
+            if code is None:
+                with open(filename, "rb") as f:
+                    code = compile(f.read(), filename, "exec")
+        exec(code, namespace)
+    except SystemExit as e:
+        # Same mapping as the interpreter: None is success, other codes
+        # (e.g. a message) are printed to stderr and exit with status 1
+        if e.code is None:
+            status = 0
+        elif isinstance(e.code, int):
+            status = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            status = 1
+    except BaseException:
+        traceback.print_exc()
+        status = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+
+
+def _serve(fd: int) -> None:
+    """Serve fork requests on a socket until it is closed."""
+    import pty
+
+    # Import everything an app needs once, before any fork
+    import blessed  # noqa: F401
+    import rawgui.elements
+    import rawgui.run  # noqa: F401
+    import rawgui.renderer.terminal  # noqa: F401
+    import rawgui.ui  # noqa: F401
+
+    # Element modules load lazily; resolve them all so children inherit them
+    for name in rawgui.elements.__all__:
+        getattr(rawgui.elements, name)
+
+    # Children are killed by their terminal; let the kernel reap them
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+
+    compiled: Dict[tuple, CodeType] = {}
+    sock = socket.socket(fileno=fd)
+    requests = sock.makefile("r")
+    for line in requests:
+        request = json.loads(line)
+        filename, code = _compile_app(request, compiled)
+        pid, master_fd = pty.fork()
+        if pid == 0:
+            requests.close()
+            sock.close()
+            _run_app(request, filename, code)
+        socket.send_fds(sock, [json.dumps({"pid": pid}).encode()], [master_fd])
+        os.close(master_fd)
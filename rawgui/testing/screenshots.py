@@ -26,8 +26,6 @@ import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
-from PIL import Image
-
 if TYPE_CHECKING:
     pass
 
@@ -17,15 +17,24 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import os
 import re
+import select
+import shlex
+import shutil
+import tempfile
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import pexpect
 import pyte
-from PIL import Image, ImageDraw, ImageFont
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 
 class SubprocessTerminal:
@@ -48,28 +57,51 @@ class SubprocessTerminal:
         "⌫": "\x7f",    # Backspace
     }
 
+    # zlib level for PNG output. Screenshots are test artifacts, so encode
+    # speed matters more than size (level 1 vs. the default 6: about a
+    # third faster, about a third larger)
+    PNG_COMPRESS_LEVEL = 1
+
+    # Screenshots already rendered, keyed by a hash of the screen contents
+    # and render options. The PNGs live in a private directory owned by the
+    # cache (callers' output paths may be overwritten at any time) and are
+    # linked or copied to the requested path. Shared by all terminals; least
+    # recently used entries are dropped beyond SCREENSHOT_CACHE_SIZE.
+    SCREENSHOT_CACHE_SIZE = 128
+    _screenshot_cache: "OrderedDict[bytes, Path]" = OrderedDict()
+    _screenshot_cache_dir: Optional[Path] = None
+
     def __init__(
         self,
-        command: str,
+        command: str | Sequence[str],
         rows: int = 24,
         cols: int = 80,
         cwd: Optional[str] = None,
         env: Optional[Dict[str, str]] = None,
+        script: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """Initialize the subprocess terminal.
 
         Args:
-            command: The command to run (e.g., "poetry run rawgui")
+            command: The command to run (e.g., "poetry run rawgui"), or its
+                argument list; an absolute program path skips the PATH lookup
             rows: Terminal height in rows
             cols: Terminal width in columns
             cwd: Working directory for the process
             env: Additional environment variables
+            script: Python source to pass as ``-c`` to ``command`` (an
+                interpreter), so no script file has to be written
+            clock: Monotonic time source for wait deadlines; tests can pass
+                a fake clock to make timeout paths return immediately
         """
         self.command = command
+        self.script = script
         self.rows = rows
         self.cols = cols
         self.cwd = cwd
         self.env = env or {}
+        self._clock = clock
 
         # PTY process
         self._process: Optional[pexpect.spawn] = None
@@ -77,6 +109,16 @@ class SubprocessTerminal:
         # Terminal emulator
         self._screen = pyte.Screen(cols, rows)
         self._stream = pyte.Stream(self._screen)
+        # Answer status/cursor-position queries like a real terminal; blessed
+        # sends one on startup and blocks until it is answered or times out
+        self._screen.write_process_input = self._write_reply
+
+        # Screen text, valid until the next output is fed to the emulator;
+        # per-row text is rebuilt only for rows pyte reports as dirty
+        self._text_cache: Optional[str] = None
+        self._row_text: List[str] = [""] * rows
+        # (render options, digest) of the last screenshot, same lifetime
+        self._last_digest: Optional[Tuple[tuple, bytes]] = None
 
     def start(self, timeout: float = 10.0) -> None:
         """Start the terminal process.
@@ -90,8 +132,15 @@ class SubprocessTerminal:
         process_env["TERM"] = "xterm-256color"
 
         # Spawn the process
+        if isinstance(self.command, str):
+            argv = shlex.split(self.command)
+        else:
+            argv = list(self.command)
+        if self.script is not None:
+            argv += ["-c", self.script]
         self._process = pexpect.spawn(
-            self.command,
+            argv[0],
+            argv[1:],
             encoding="utf-8",
             timeout=timeout,
             cwd=self.cwd,
@@ -99,9 +148,8 @@ class SubprocessTerminal:
             dimensions=(self.rows, self.cols),
         )
 
-        # Give it a moment to initialize
-        time.sleep(0.5)
-        self._read_output()
+        # Give it a moment to initialize (returns early once output arrives)
+        self.wait_ready(timeout=0.5)
 
     def stop(self) -> None:
         """Stop the terminal process."""
@@ -181,18 +229,28 @@ class SubprocessTerminal:
         """Press Backspace key."""
         self.send_keys("⌫" * count, delay)
 
-    def _read_output(self) -> None:
-        """Read available output from the process and update screen."""
+    def _write_reply(self, data: str) -> None:
+        """Send a terminal report (e.g. a cursor position) to the process."""
+        if self._process:
+            self._process.send(data)
+
+    def _read_output(self, timeout: float = 0.1) -> None:
+        """Read available output from the process and update screen.
+
+        Args:
+            timeout: How long to wait for further output after each chunk
+        """
         if not self._process:
             return
 
+        chunks: List[str] = []
         try:
-            # Read all available output (non-blocking)
+            # Read all available output (non-blocking) in large chunks
             while True:
                 try:
-                    data = self._process.read_nonblocking(size=4096, timeout=0.1)
+                    data = self._process.read_nonblocking(size=65536, timeout=timeout)
                     if data:
-                        self._stream.feed(data)
+                        chunks.append(data)
                     else:
                         break
                 except pexpect.TIMEOUT:
@@ -202,6 +260,12 @@ class SubprocessTerminal:
         except Exception:
             pass
 
+        # Feed the emulator once per drain
+        if chunks:
+            self._stream.feed("".join(chunks))
+            self._text_cache = None
+            self._last_digest = None
+
     def get_text(self) -> str:
         """Get the current terminal content as text.
 
@@ -209,19 +273,44 @@ class SubprocessTerminal:
             Multi-line string of terminal content
         """
         self._read_output()
-        lines = []
-        for row in range(self.rows):
-            line = "".join(
-                self._screen.buffer[row][col].data
-                for col in range(self.cols)
-            )
-            lines.append(line.rstrip())
+        return self._screen_text()
+
+    def _screen_text(self) -> str:
+        """Get the emulated screen as text without reading new output."""
+        if self._text_cache is not None:
+            return self._text_cache
+        self._refresh_rows()
+        lines = list(self._row_text)
 
         # Remove trailing empty lines
         while lines and not lines[-1]:
             lines.pop()
 
-        return "\n".join(lines)
+        self._text_cache = "\n".join(lines)
+        return self._text_cache
+
+    def _refresh_rows(self) -> None:
+        """Rebuild the cached text of rows pyte marked as changed."""
+        dirty = self._screen.dirty
+        if not dirty:
+            return
+        buffer = self._screen.buffer
+        cols = range(self.cols)
+        for row in dirty:
+            if row < self.rows:
+                line = buffer[row]
+                self._row_text[row] = "".join(line[col].data for col in cols).rstrip()
+        dirty.clear()
+
+    def _screen_lines(self) -> List[str]:
+        """Get every row at full width, built from the cached row text.
+
+        Rows are padded back to the terminal width, so searches see the
+        same trailing spaces as the screen buffer.
+        """
+        self._refresh_rows()
+        cols = self.cols
+        return [line.ljust(cols) for line in self._row_text]
 
     def get_line(self, row: int) -> str:
         """Get a specific line from the terminal.
@@ -234,13 +323,43 @@ class SubprocessTerminal:
         """
         self._read_output()
         if 0 <= row < self.rows:
-            line = "".join(
-                self._screen.buffer[row][col].data
-                for col in range(self.cols)
-            )
-            return line.rstrip()
+            self._refresh_rows()
+            return self._row_text[row]
         return ""
 
+    def clear_screen(self) -> None:
+        """Blank the emulated screen, discarding all output read so far.
+
+        Output already waiting on the PTY is drained first, so it does not
+        reappear afterwards. The process itself is not affected.
+        """
+        self._read_output(timeout=0)
+        self._screen.reset()
+        self._text_cache = None
+        self._last_digest = None
+
+    def wait_ready(self, timeout: float = 2.0) -> bool:
+        """Wait until the process has produced any output.
+
+        Blocks on the PTY, so it returns as soon as the first output
+        arrives.
+
+        Args:
+            timeout: Maximum time to wait
+
+        Returns:
+            True if output appeared, False if timeout
+        """
+        deadline = self._clock() + timeout
+        while True:
+            self._read_output(timeout=0)
+            if self._screen_text():
+                return True
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                return False
+            self._wait_for_output(remaining)
+
     def wait_for_text(
         self,
         text: str,
@@ -249,21 +368,65 @@ class SubprocessTerminal:
     ) -> bool:
         """Wait for specific text to appear on screen.
 
+        Sleeps on the PTY until the process writes something, so the check
+        runs as soon as new output arrives rather than on a fixed schedule.
+
         Args:
             text: Text to wait for
             timeout: Maximum time to wait
-            poll_interval: How often to check
+            poll_interval: Maximum delay between checks
 
         Returns:
             True if text found, False if timeout
         """
-        start = time.time()
-        while time.time() - start < timeout:
-            content = self.get_text()
-            if text in content:
+        deadline = self._clock() + timeout
+        while True:
+            self._read_output(timeout=0)
+            if text in self._screen_text():
                 return True
-            time.sleep(poll_interval)
-        return False
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                return False
+            self._wait_for_output(min(poll_interval, remaining))
+
+    def wait_for_idle(self, timeout: float = 1.0, quiet: float = 0.05) -> bool:
+        """Wait until the process stops producing output.
+
+        Returns as soon as no output arrived for ``quiet`` seconds, so a
+        settled screen does not cost the full timeout.
+
+        Args:
+            timeout: Maximum time to wait
+            quiet: How long the output must stay silent
+
+        Returns:
+            True if the output settled, False if timeout
+        """
+        deadline = self._clock() + timeout
+        while True:
+            self._read_output(timeout=0)
+            wait = min(quiet, deadline - self._clock())
+            if wait <= 0:
+                return False
+            if not self._wait_for_output(wait):
+                return True
+
+    def _wait_for_output(self, timeout: float) -> bool:
+        """Block until the process has output to read or the timeout passes.
+
+        Returns:
+            True if output is ready to be read
+        """
+        process = self._process
+        if process is None or process.flag_eof:
+            time.sleep(timeout)
+            return False
+        try:
+            ready, _, _ = select.select([process.child_fd], [], [], timeout)
+        except (OSError, ValueError):
+            time.sleep(timeout)
+            return False
+        return bool(ready)
 
     def find_text(self, text: str) -> List[Tuple[int, int]]:
         """Find all occurrences of text on screen.
@@ -277,11 +440,7 @@ class SubprocessTerminal:
         self._read_output()
         positions = []
 
-        for row in range(self.rows):
-            line = "".join(
-                self._screen.buffer[row][col].data
-                for col in range(self.cols)
-            )
+        for row, line in enumerate(self._screen_lines()):
             col = 0
             while True:
                 idx = line.find(text, col)
@@ -305,11 +464,7 @@ class SubprocessTerminal:
         matches = []
         regex = re.compile(pattern)
 
-        for row in range(self.rows):
-            line = "".join(
-                self._screen.buffer[row][col].data
-                for col in range(self.cols)
-            )
+        for row, line in enumerate(self._screen_lines()):
             for match in regex.finditer(line):
                 matches.append((row, match.start(), match.group()))
 
@@ -326,6 +481,20 @@ class SubprocessTerminal:
         """
         return text in self.get_text()
 
+    def contains_all(self, texts: Iterable[str]) -> bool:
+        """Check if every text exists on screen.
+
+        Reads the screen once for all checks.
+
+        Args:
+            texts: Texts to find
+
+        Returns:
+            True if all texts are found
+        """
+        content = self.get_text()
+        return all(text in content for text in texts)
+
     def should_contain(self, text: str) -> None:
         """Assert that text exists on screen.
 
@@ -450,6 +619,73 @@ class SubprocessTerminal:
         self._read_output()
         path = Path(path)
 
+        # Rendered once per distinct screen, then copied into place; never
+        # linked, so writes to the returned file cannot reach the cache
+        cached = self._cached_screenshot((font_size, bg_color, fg_color))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached, path)
+        return path
+
+    def screenshot_bytes(
+        self,
+        font_size: int = 14,
+        bg_color: str = "#1a1a2e",
+        fg_color: str = "#eaeaea",
+    ) -> bytes:
+        """Render terminal content to PNG data without writing a file.
+
+        Args:
+            font_size: Font size in pixels
+            bg_color: Background color (hex)
+            fg_color: Default foreground/text color (hex)
+
+        Returns:
+            The PNG-encoded image
+        """
+        self._read_output()
+        return self._cached_screenshot((font_size, bg_color, fg_color)).read_bytes()
+
+    def _cached_screenshot(self, options: tuple) -> Path:
+        """Get the cache's PNG of the current screen, rendering it if needed.
+
+        Args:
+            options: (font_size, bg_color, fg_color) render options
+
+        Returns:
+            Path of the PNG inside the cache directory; callers must not
+            modify it
+        """
+        cache = self._screenshot_cache
+        digest = self._screenshot_digest(options)
+        cached = cache.get(digest)
+        if cached is not None and cached.exists():
+            cache.move_to_end(digest)
+            return cached
+
+        cache_dir = SubprocessTerminal._screenshot_cache_dir
+        if cache_dir is None or not cache_dir.is_dir():
+            cache_dir = Path(tempfile.mkdtemp(prefix="rawgui-screenshots-"))
+            atexit.register(shutil.rmtree, cache_dir, ignore_errors=True)
+            SubprocessTerminal._screenshot_cache_dir = cache_dir
+
+        cached = cache_dir / f"{digest.hex()}.png"
+        img = self._render_image(*options)
+        img.save(str(cached), compress_level=self.PNG_COMPRESS_LEVEL)
+
+        cache[digest] = cached
+        if len(cache) > self.SCREENSHOT_CACHE_SIZE:
+            _, evicted = cache.popitem(last=False)
+            evicted.unlink(missing_ok=True)
+        return cached
+
+    def _render_image(
+        self, font_size: int, bg_color: str, fg_color: str
+    ) -> Image.Image:
+        """Draw the emulated screen with colors into a new image."""
+        # PIL is only needed here; importing it lazily keeps
+        # "import rawgui.testing" fast for tests that take no screenshots
+        from PIL import Image, ImageDraw, ImageFont
+
         # Try to load a monospace font with good Unicode support
         font = None
         font_paths = [
@@ -512,10 +748,27 @@ class SubprocessTerminal:
                 if char_data.strip():
                     draw.text((x, y), char_data, font=font, fill=char_color)
 
-        # Save
-        path.parent.mkdir(parents=True, exist_ok=True)
-        img.save(str(path))
-        return path
+        return img
+
+    def _screenshot_digest(self, options: tuple) -> bytes:
+        """Digest of the screen and render options, reused until new output.
+
+        The screen is only re-hashed if output arrived since the last shot.
+        """
+        if self._last_digest is not None and self._last_digest[0] == options:
+            return self._last_digest[1]
+        digest = self._screen_digest(*options)
+        self._last_digest = (options, digest)
+        return digest
+
+    def _screen_digest(self, *options: object) -> bytes:
+        """Hash the screen's characters and attributes plus render options."""
+        h = hashlib.sha256(repr((self.rows, self.cols, options)).encode())
+        buffer = self._screen.buffer
+        for row in range(self.rows):
+            line = buffer[row]
+            h.update(repr([line[col] for col in range(self.cols)]).encode())
+        return h.digest()
 
     def __enter__(self) -> "SubprocessTerminal":
         """Context manager entry."""
@@ -528,7 +781,7 @@ class SubprocessTerminal:
 
 
 def run_terminal_test(
-    command: str,
+    command: str | Sequence[str],
     actions: List[Tuple[str, str | float]],
     screenshot_path: Optional[str] = None,
     timeout: float = 10.0,
@@ -538,12 +791,12 @@ def run_terminal_test(
     """Run a quick terminal test with a sequence of actions.
 
     Args:
-        command: Command to run
+        command: Command to run (string or argument list)
         actions: List of (action_type, value) tuples:
             - ("wait", "text") - wait for text
             - ("keys", "↓↓\\n") - send keys
             - ("text", "hello") - send plain text
-            - ("delay", 0.5) - sleep for seconds
+            - ("delay", 0.5) - wait up to 0.5 s for the output to settle
             - ("assert", "text") - assert text is present
             - ("assert_not", "text") - assert text is not present
         screenshot_path: Optional path to save screenshot
@@ -576,7 +829,7 @@ def run_terminal_test(
             elif action_type == "text":
                 term.send_text(str(value))
             elif action_type == "delay":
-                time.sleep(float(value))
+                term.wait_for_idle(timeout=float(value))
             elif action_type == "assert":
                 term.should_contain(str(value))
             elif action_type == "assert_not":
@@ -25,23 +25,30 @@ Usage:
 
 from __future__ import annotations
 
+import ast
 import asyncio
+import bisect
+import hashlib
 import sys
-import time
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
-
-from PIL import Image
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
 
 if TYPE_CHECKING:
+    from PIL import Image
+
     from ..element import Element
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementInfo:
-    """Information about a rendered element."""
+    """Information about a rendered element.
+
+    Slotted, since one instance is created per element on every render.
+    """
     element: "Element"
     x: int
     y: int
@@ -61,6 +68,39 @@ class ElementInfo:
         return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
 
 
+def _is_main_guard(node: ast.stmt) -> bool:
+    """Check for ``if __name__ == "__main__":`` (or ``in {...}``) blocks."""
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    operands = [node.test.left, *node.test.comparators]
+    return any(isinstance(op, ast.Name) and op.id == "__name__" for op in operands)
+
+
+def _is_ui_run(node: ast.stmt) -> bool:
+    """Check for a bare ``ui.run(...)`` call statement."""
+    if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+        return False
+    func = node.value.func
+    return (
+        isinstance(func, ast.Attribute)
+        and func.attr == "run"
+        and isinstance(func.value, ast.Name)
+        and func.value.id == "ui"
+    )
+
+
+def _strip_entry_points(tree: ast.Module) -> ast.Module:
+    """Remove top-level ``__main__`` guards and ``ui.run()`` calls from a script.
+
+    Test users build pages themselves, so the script must only define them.
+    """
+    tree.body = [
+        node for node in tree.body
+        if not _is_main_guard(node) and not _is_ui_run(node)
+    ]
+    return tree
+
+
 class BaseUser(ABC):
     """Abstract base class for test users."""
 
@@ -160,10 +200,17 @@ class BaseUser(ABC):
 class TUIUser(BaseUser):
     """Test user for TUI renderer using subprocess."""
 
-    def __init__(self, script_path: str, width: int = 80, height: int = 24):
+    def __init__(
+        self,
+        script_path: str,
+        width: int = 80,
+        height: int = 24,
+        startup_timeout: float = 2.0,
+    ):
         self.script_path = Path(script_path).resolve()
         self.width = width
         self.height = height
+        self.startup_timeout = startup_timeout
         self._terminal: Optional["SubprocessTerminal"] = None
 
     def start(self) -> None:
@@ -171,7 +218,7 @@ class TUIUser(BaseUser):
         command = f"poetry run python {self.script_path}"
         self._terminal = SubprocessTerminal(command, rows=self.height, cols=self.width)
         self._terminal.start()
-        time.sleep(0.5)  # Wait for startup
+        self._terminal.wait_ready(timeout=self.startup_timeout)
 
     def stop(self) -> None:
         if self._terminal:
@@ -238,14 +285,44 @@ class TUIUser(BaseUser):
 class TkinterUser(BaseUser):
     """Test user for Tkinter renderer (headless)."""
 
-    def __init__(self, script_path: str, width: int = 800, height: int = 600):
+    # Cell size (pixels) of the hit-testing grid built per render
+    HIT_CELL_SIZE = 32
+
+    # Idle adapters keyed by (width, height, dark, render_pixels), shared
+    # across instances so repeated sessions skip adapter setup
+    _adapter_pool: Dict[Tuple[int, int, bool, bool], List["TkinterAdapter"]] = defaultdict(list)
+
+    def __init__(
+        self,
+        script_path: str,
+        width: int = 800,
+        height: int = 600,
+        no_pixels: bool = False,
+    ):
+        """Initialize the test user.
+
+        Args:
+            script_path: Path to the script to test
+            width: Render width in pixels
+            height: Render height in pixels
+            no_pixels: Skip painting and only build the render tree. Text and
+                element queries keep working; screenshot() and get_image()
+                raise RuntimeError.
+        """
         self.script_path = Path(script_path).resolve()
         self.width = width
         self.height = height
+        self.no_pixels = no_pixels
         self._adapter: Optional["TkinterAdapter"] = None
         self._client: Optional["Client"] = None
         self._root: Optional["Element"] = None
         self._elements: List[ElementInfo] = []
+        self._hit_grid: Dict[Tuple[int, int], List[ElementInfo]] = {}
+        self._snapshot_hashes: Dict[Path, bytes] = {}
+        self._text_elements: List[ElementInfo] = []
+        self._tag_elements: Dict[str, List[ElementInfo]] = {}
+        self._text_offsets: List[int] = []
+        self._joined_text: str = ""
 
     def start(self) -> None:
         from ..adapters import TkinterAdapter
@@ -277,31 +354,26 @@ class TkinterUser(BaseUser):
         if script_dir not in sys.path:
             sys.path.insert(0, script_dir)
 
-        # Execute script in fresh namespace
-        with open(self.script_path) as f:
-            code = f.read()
-            lines = code.split("\n")
-            filtered = []
-            skip_if_main = False
-            for line in lines:
-                if '__name__' in line and '__main__' in line:
-                    skip_if_main = True
-                    continue
-                if skip_if_main:
-                    if line.strip() and not line.startswith(" ") and not line.startswith("\t"):
-                        skip_if_main = False
-                    else:
-                        continue
-                if "ui.run(" in line:
-                    continue
-                filtered.append(line)
-            code = "\n".join(filtered)
-            # Use fresh globals dict to avoid state persistence
-            self._script_globals = {"__name__": "__script__", "__file__": str(self.script_path)}
-            exec(compile(code, self.script_path, "exec"), self._script_globals)
-
-        # Create adapter and client
-        self._adapter = TkinterAdapter(width=self.width, height=self.height, title="Test", dark=True)
+        # Execute script in fresh namespace, without its __main__ guard or ui.run()
+        source = self.script_path.read_text()
+        tree = _strip_entry_points(ast.parse(source, filename=str(self.script_path)))
+        # Use fresh globals dict to avoid state persistence
+        self._script_globals = {"__name__": "__script__", "__file__": str(self.script_path)}
+        exec(compile(tree, str(self.script_path), "exec"), self._script_globals)
+
+        # Reuse a pooled adapter or create one, then the client
+        pool = self._adapter_pool[self._pool_key]
+        if pool:
+            self._adapter = pool.pop()
+            self._adapter.reset()
+        else:
+            self._adapter = TkinterAdapter(
+                width=self.width,
+                height=self.height,
+                title="Test",
+                dark=True,
+                render_pixels=not self.no_pixels,
+            )
         self._client = Client()
 
         # Build initial page
@@ -371,43 +443,158 @@ class TkinterUser(BaseUser):
 
     def _index_elements(self) -> None:
         """Index all rendered elements."""
-        self._elements = []
         if not self._adapter or not self._adapter._render_tree:
+            self._elements = []
+            self._hit_grid = {}
+            self._index_text()
+            self._index_tags()
             return
 
-        def walk(node):
-            if node.element:
+        self._elements = list(self._walk(self._adapter._render_tree))
+        self._build_hit_grid()
+        self._index_text()
+        self._index_tags()
+
+    def _index_tags(self) -> None:
+        """Group elements by tag once per render, in document order."""
+        tag_elements: Dict[str, List[ElementInfo]] = defaultdict(list)
+        for el in self._elements:
+            tag_elements[el.tag].append(el)
+        self._tag_elements = dict(tag_elements)
+
+    def _index_text(self) -> None:
+        """Join element texts once per render for C-level substring search.
+
+        ``_text_offsets[i]`` is where ``_text_elements[i]`` starts inside
+        ``_joined_text``, so a match position maps back to its element by
+        binary search.
+        """
+        self._text_elements = [el for el in self._elements if el.text]
+        self._text_offsets = []
+        offset = 0
+        for el in self._text_elements:
+            self._text_offsets.append(offset)
+            offset += len(el.text) + 1
+        self._joined_text = "\n".join(el.text for el in self._text_elements)
+
+    def get_text(self) -> str:
+        return self._joined_text
+
+    def contains(self, text: str) -> bool:
+        return text in self._joined_text
+
+    def find_by_text(self, text: str) -> Optional[ElementInfo]:
+        if not text or "\n" in text:
+            # Empty or separator-spanning queries use the per-element scan
+            return super().find_by_text(text)
+        pos = self._joined_text.find(text)
+        if pos < 0:
+            return None
+        return self._text_elements[bisect.bisect_right(self._text_offsets, pos) - 1]
+
+    def find_by_tag(self, tag: str) -> List[ElementInfo]:
+        return list(self._tag_elements.get(tag, ()))
+
+    def _build_hit_grid(self) -> None:
+        """Bucket clickable elements by grid cell for fast hit testing.
+
+        Only focusable elements are indexed, matching the adapter's own
+        hit testing. Buckets keep document order; lookups scan them in
+        reverse so later (topmost) elements win.
+        """
+        cell = self.HIT_CELL_SIZE
+        grid: Dict[Tuple[int, int], List[ElementInfo]] = defaultdict(list)
+        for info in self._elements:
+            if not self._adapter._is_focusable(info.element):
+                continue
+            for gx in range(info.x // cell, (info.x + info.width) // cell + 1):
+                for gy in range(info.y // cell, (info.y + info.height) // cell + 1):
+                    grid[(gx, gy)].append(info)
+        self._hit_grid = dict(grid)
+
+    def element_at(self, x: int, y: int) -> Optional["Element"]:
+        """Get the clickable element at coordinates from the hit grid.
+
+        Args:
+            x: X coordinate (pixels)
+            y: Y coordinate (pixels)
+
+        Returns:
+            Topmost focusable element containing the point, or None
+        """
+        cell = self.HIT_CELL_SIZE
+        for info in reversed(self._hit_grid.get((x // cell, y // cell), ())):
+            # Right and bottom edges count as inside, like the adapter's _hit_test
+            if info.x <= x <= info.x + info.width and info.y <= y <= info.y + info.height:
+                return info.element
+        return None
+
+    @staticmethod
+    def _walk(root) -> Iterator[ElementInfo]:
+        """Yield ElementInfo for every rendered element in document order.
+
+        Uses an explicit stack instead of recursion, so deep trees neither
+        allocate a Python frame per node nor hit the recursion limit.
+        """
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            element = node.element
+            if element:
                 text = ""
-                if hasattr(node.element, "text"):
-                    text = getattr(node.element, "text", "") or ""
-                elif hasattr(node.element, "label"):
-                    text = getattr(node.element, "label", "") or ""
+                if hasattr(element, "text"):
+                    text = getattr(element, "text", "") or ""
+                elif hasattr(element, "label"):
+                    text = getattr(element, "label", "") or ""
 
-                self._elements.append(ElementInfo(
-                    element=node.element,
+                yield ElementInfo(
+                    element=element,
                     x=node.x,
                     y=node.y,
                     width=node.width,
                     height=node.height,
                     text=text,
-                    tag=node.element.tag,
+                    tag=sys.intern(element.tag),
                     focused=node.focused,
-                ))
-            for child in node.children:
-                walk(child)
+                )
+            # Reversed so children pop in their original order
+            stack.extend(reversed(node.children))
 
-        walk(self._adapter._render_tree)
+    @property
+    def _pool_key(self) -> Tuple[int, int, bool, bool]:
+        return (self.width, self.height, True, not self.no_pixels)
 
     def stop(self) -> None:
+        if self._adapter:
+            self._adapter.reset()
+            self._adapter_pool[self._pool_key].append(self._adapter)
         self._adapter = None
         self._client = None
         self._root = None
         self._elements = []
+        self._hit_grid = {}
+        self._text_elements = []
+        self._text_offsets = []
+        self._joined_text = ""
 
     def screenshot(self, path: str) -> Path:
+        """Save the current render as PNG.
+
+        The file is only rewritten when the frame differs from the one last
+        saved to the same path by this user.
+        """
         if not self._adapter:
             raise RuntimeError("Not started")
-        return self._adapter.screenshot(path)
+        path = Path(path)
+        img = self._adapter.get_image()
+        digest = hashlib.blake2b(img.tobytes(), digest_size=16).digest()
+        if self._snapshot_hashes.get(path) == digest and path.exists():
+            return path
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        img.save(str(path), compress_level=1)
+        self._snapshot_hashes[path] = digest
+        return path
 
     def get_image(self) -> Image.Image:
         """Get current render as PIL Image."""
@@ -424,7 +611,7 @@ class TkinterUser(BaseUser):
             raise RuntimeError("Not started")
 
         # Find element at position
-        element = self._adapter.get_element_at(x, y)
+        element = self.element_at(x, y)
         if element:
             # Focus the element
             self._adapter.focus_element(element)
@@ -521,7 +708,7 @@ class User:
         Args:
             script_path: Path to the script to test
             renderer: "tui" or "tkinter"
-            **kwargs: Additional arguments (width, height)
+            **kwargs: Additional arguments (width, height, no_pixels for tkinter)
 
         Returns:
             TUIUser or TkinterUser instance
@@ -532,6 +719,25 @@ class User:
             return TkinterUser(script_path, **kwargs)
 
 
+@lru_cache(maxsize=32)
+def _load_rgb(path: str, mtime_ns: int, size: int) -> Image.Image:
+    """Decode an image file to RGB, cached while the file is unchanged.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so a
+    rewritten file is decoded again. Callers must not modify the result.
+    """
+    from PIL import Image
+
+    with Image.open(path) as img:
+        return img.convert("RGB")
+
+
+def _open_rgb(path: str) -> Image.Image:
+    """Open an image file as RGB through the decode cache."""
+    stat = Path(path).stat()
+    return _load_rgb(str(path), stat.st_mtime_ns, stat.st_size)
+
+
 def compare_images(img1: Image.Image | str, img2: Image.Image | str, threshold: float = 0.01) -> Tuple[bool, float]:
     """Compare two images and return similarity.
 
@@ -544,26 +750,28 @@ def compare_images(img1: Image.Image | str, img2: Image.Image | str, threshold:
         (are_equal, difference_ratio)
     """
     if isinstance(img1, str):
-        img1 = Image.open(img1)
+        img1 = _open_rgb(img1)
     if isinstance(img2, str):
-        img2 = Image.open(img2)
+        img2 = _open_rgb(img2)
 
     # Ensure same size
     if img1.size != img2.size:
         return False, 1.0
 
-    # Convert to same mode
-    img1 = img1.convert("RGB")
-    img2 = img2.convert("RGB")
+    from PIL import ImageChops
 
-    # Calculate pixel differences
-    pixels1 = list(img1.getdata())
-    pixels2 = list(img2.getdata())
-
-    diff_count = 0
-    for p1, p2 in zip(pixels1, pixels2):
-        if p1 != p2:
-            diff_count += 1
-
-    diff_ratio = diff_count / len(pixels1)
+    # Convert to same mode
+    if img1.mode != "RGB":
+        img1 = img1.convert("RGB")
+    if img2.mode != "RGB":
+        img2 = img2.convert("RGB")
+
+    # Per-pixel difference in C: a pixel differs if any channel does, so
+    # take the largest channel difference and count the non-zero pixels
+    red, green, blue = ImageChops.difference(img1, img2).split()
+    changed = ImageChops.lighter(ImageChops.lighter(red, green), blue)
+    total = img1.width * img1.height
+    diff_count = total - changed.histogram()[0]
+
+    diff_ratio = diff_count / total
     return diff_ratio <= threshold, diff_ratio
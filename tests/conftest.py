@@ -0,0 +1,114 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the --smoke option."""
+    parser.addoption(
+        "--smoke",
+        action="store_true",
+        help="run one representative test per widget (deselect widgets_full)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect exhaustive widget tests when --smoke is given."""
+    if not config.getoption("--smoke"):
+        return
+    selected, deselected = [], []
+    for item in items:
+        (deselected if "widgets_full" in item.keywords else selected).append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_renderer():
+    """Render once before the first test so one-time costs are paid upfront.
+
+    The first TerminalRenderer in a process sets up terminfo, and the first
+    render imports and compiles the layout and compositor code paths.
+    """
+    from rawgui import ui
+    from rawgui.client import Client
+    from rawgui.renderer.terminal import TerminalRenderer
+
+    renderer = TerminalRenderer()
+    client = Client()
+    with client:
+        card = ui.card()
+        toggle = ui.toggle("x")
+    renderer.render(card)
+    renderer.render(toggle)
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def examples() -> Dict[str, Path]:
+    """Example applications by file name, scanned once per session."""
+    examples_dir = (Path(__file__).parent.parent / "examples").resolve()
+    if not examples_dir.is_dir():
+        return {}
+    return {path.name: path for path in examples_dir.iterdir()}
+
+
+@pytest.fixture(scope="session")
+def app_runner():
+    """Pre-warmed runner that forks each terminal app instead of spawning Python."""
+    from rawgui.testing import AppRunner
+
+    with AppRunner() as runner:
+        yield runner
+
+
+@pytest.fixture(scope="session")
+def style_mapper():
+    """StyleMapper shared by all tests; it holds no per-call state."""
+    from rawgui.renderer.styles import StyleMapper
+
+    return StyleMapper()
+
+
+@pytest.fixture(scope="class")
+def shared_renderer():
+    """TerminalRenderer shared by the tests of a class."""
+    from rawgui.renderer.terminal import TerminalRenderer
+
+    return TerminalRenderer()
+
+
+@pytest.fixture
+def renderer(shared_renderer):
+    """The class's shared TerminalRenderer, reset for this test."""
+    shared_renderer.reset()
+    return shared_renderer
+
+
+@pytest.fixture(scope="class")
+def screenshot_dir(request, tmp_path_factory) -> Path:
+    """Directory for the screenshots of a class, created once for all its tests."""
+    name = request.cls.__name__ if request.cls is not None else "screens"
+    return tmp_path_factory.mktemp(name)
+
+
+@pytest.fixture(scope="class")
+def shared_client():
+    """Client shared by the tests of a class."""
+    from rawgui.client import Client
+
+    client = Client()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def client(shared_client):
+    """The class's shared Client, reset and active for this test."""
+    shared_client.reset()
+    with shared_client:
+        yield shared_client
@@ -6,14 +6,15 @@ from rawgui.client import Client
 from rawgui.renderer.terminal import TerminalRenderer
 
 
+pytestmark = pytest.mark.xdist_group("unit")
+
+
 class TestDialogShadow:
     """Tests for dialog with shadow effect."""
 
-    def test_dialog_not_rendered_when_closed(self):
+    def test_dialog_not_rendered_when_closed(self, renderer):
         """Test that closed dialog is not rendered."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
+        with Client.get_pooled():
             with ui.column() as col:
                 ui.label("Background content")
                 with ui.dialog() as dialog:
@@ -23,11 +24,9 @@ class TestDialogShadow:
         assert "Background content" in output
         assert "Dialog content" not in output  # Dialog is closed
 
-    def test_dialog_rendered_when_open(self):
+    def test_dialog_rendered_when_open(self, renderer):
         """Test that open dialog is rendered."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
+        with Client.get_pooled():
             with ui.column() as col:
                 ui.label("Background content")
                 dialog = ui.dialog(value=True)
@@ -36,45 +35,39 @@ class TestDialogShadow:
         # Open dialog should be visible (though it may not have content)
         assert "Background content" in output
 
-    def test_dialog_has_shadow_layer(self):
+    def test_dialog_has_shadow_layer(self, renderer):
         """Test that dialog creates a shadow layer."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
+        with Client.get_pooled():
             with ui.column() as col:
                 ui.label("Background")
                 dialog = ui.dialog(value=True)
 
-        renderer.render(col)
+        compositor = renderer.build_layers(col)
 
         # Compositor should have overlay layer for dialog
-        if renderer._compositor:
-            layer_names = list(renderer._compositor._layers.keys())
+        if compositor:
+            layer_names = list(compositor._layers.keys())
             # Should have base layer plus dialog overlay
             assert "base" in layer_names
 
-    def test_multiple_dialogs_stack(self):
+    def test_multiple_dialogs_stack(self, renderer):
         """Test that multiple dialogs stack correctly."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
+        with Client.get_pooled():
             with ui.column() as col:
                 ui.label("Background")
                 dialog1 = ui.dialog(value=True)
                 dialog2 = ui.dialog(value=True)
 
-        renderer.render(col)
+        renderer.build_layers(col)
 
         # Both dialogs should be tracked
         overlays = renderer._find_overlays(col)
         visible = [o for o in overlays if o.visible]
         assert len(visible) == 2
 
-    def test_dialog_with_card_renders(self):
+    def test_dialog_with_card_renders(self, renderer):
         """Test dialog with card content renders correctly."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
+        with Client.get_pooled():
             with ui.column() as col:
                 ui.label("Main content")
                 with ui.dialog(value=True) as dialog:
@@ -85,11 +78,9 @@ class TestDialogShadow:
         output = renderer.render(col)
         assert "Main content" in output
 
-    def test_closed_dialog_skipped_in_base_render(self):
+    def test_closed_dialog_skipped_in_base_render(self, renderer):
         """Test that closed dialogs don't affect base rendering."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
+        with Client.get_pooled():
             with ui.column() as col:
                 ui.label("Line 1")
                 with ui.dialog() as dialog:  # Closed by default
@@ -101,6 +92,21 @@ class TestDialogShadow:
         assert "Line 2" in output
         assert "Hidden dialog content" not in output
 
+    def test_reset_drops_overlay_layers(self, renderer):
+        """Test reset clears overlay layers and focus for the next tree."""
+        with Client.get_pooled():
+            with ui.column() as col:
+                ui.button("Behind")
+                ui.dialog(value=True)
+
+        compositor = renderer.build_layers(col)
+        assert len(compositor._layers) > 1
+        assert renderer.focused is not None
+
+        renderer.reset()
+        assert list(compositor._layers.keys()) == ["base"]
+        assert renderer.focused is None
+
 
 class TestMenuShadow:
     """Tests for menu shadow rendering."""
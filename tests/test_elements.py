@@ -1,11 +1,16 @@
 """Tests for RawGUI UI elements."""
 
+import sys
+
 import pytest
 from rawgui import ui
 from rawgui.context import context
 from rawgui.client import Client
 
 
+pytestmark = pytest.mark.xdist_group("unit")
+
+
 class TestLabel:
     """Tests for Label element."""
 
@@ -175,3 +180,67 @@ class TestPage:
         assert match is not None
         route, params = match
         assert params['user_id'] == '123'
+
+
+class TestFactories:
+    """Tests for the lowercase ui factories."""
+
+    def test_class_factories_resolve_to_classes(self):
+        """Test registry factories are the element classes themselves."""
+        assert ui.label is ui.Label
+        assert ui.checkbox is ui.Checkbox
+        assert ui.spinner is ui.CircularProgress
+
+    def test_tab_panels_accepts_tabs_element(self):
+        """Test tab_panels keeps its tabs_element keyword."""
+        with Client():
+            with ui.tabs(value="Home") as tabs:
+                ui.tab("Home")
+            panels = ui.tab_panels(tabs_element=tabs)
+        assert isinstance(panels, ui.TabPanels)
+        assert panels.value == "Home"
+
+    def test_alias_classes_are_identical(self):
+        """Test alias classes are the same type as their originals."""
+        assert ui.Switch is ui.Toggle
+        assert ui.Divider is ui.Separator
+        assert ui.LinearProgress is ui.ProgressBar
+
+    def test_all_exports_resolve(self):
+        """Test every name in __all__ is available on the module."""
+        for name in ui.__all__:
+            assert getattr(ui, name) is not None, name
+
+
+class TestElementTag:
+    """Tests for element tags."""
+
+    def test_derived_tags_are_interned(self):
+        """Test tags derived from the class name are interned."""
+        from rawgui.element import Element
+
+        class FancyWidget(Element):
+            pass
+
+        with Client():
+            widget = FancyWidget()
+        assert widget.tag == "fancywidget"
+        assert widget.tag is sys.intern("fancywidget")
+
+
+class TestClientPool:
+    """Tests for the per-thread pooled client."""
+
+    def test_pooled_client_is_reused_and_reset(self):
+        """Test get_pooled returns one client, cleared on each acquire."""
+        with Client.get_pooled() as client:
+            label = ui.label("First")
+        client.navigate_to("/other")
+        assert client.get_element(label.id) is label
+
+        with Client.get_pooled() as again:
+            assert again is client
+            assert again.elements == {}
+            assert again.current_path == "/"
+            ui.label("Second")
+        assert len(again.elements) == 1
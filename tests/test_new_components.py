@@ -1,27 +1,39 @@
 """Tests for newly added components."""
 
+import re
+
 import pytest
 from rawgui import ui
-from rawgui.client import Client
-from rawgui.renderer.terminal import TerminalRenderer
+
+
+pytestmark = pytest.mark.xdist_group("unit")
+
+# Open or closed select dropdown indicator, found in one scan of the output
+_DROPDOWN_INDICATOR = re.compile(r"[v^]")
+
+
+def _has_all(output, needles):
+    """Check all needles occur in output; single characters share one scan."""
+    chars = {needle for needle in needles if len(needle) == 1}
+    if not chars <= set(output):
+        return False
+    return all(needle in output for needle in needles if len(needle) != 1)
 
 
 class TestDialog:
     """Tests for dialog component."""
 
-    def test_create_dialog(self):
+    def test_create_dialog(self, client):
         """Test creating a dialog."""
-        with Client() as client:
-            dialog = ui.dialog()
+        dialog = ui.dialog()
 
         assert dialog.tag == "dialog"
         assert dialog.is_open is False
         assert dialog.visible is False
 
-    def test_dialog_open_close(self):
+    def test_dialog_open_close(self, client):
         """Test opening and closing dialog."""
-        with Client() as client:
-            dialog = ui.dialog()
+        dialog = ui.dialog()
 
         dialog.open()
         assert dialog.is_open is True
@@ -31,11 +43,10 @@ class TestDialog:
         assert dialog.is_open is False
         assert dialog.visible is False
 
-    def test_dialog_with_content(self):
+    def test_dialog_with_content(self, client):
         """Test dialog with content inside."""
-        with Client() as client:
-            with ui.dialog() as dialog:
-                card = ui.card()
+        with ui.dialog() as dialog:
+            card = ui.card()
 
         # Dialog has content (card is inside the dialog's slot)
         assert dialog.tag == "dialog"
@@ -46,64 +57,74 @@ class TestDialog:
 class TestSelect:
     """Tests for select/dropdown component."""
 
-    def test_create_select_with_list(self):
+    def test_create_select_with_list(self, client):
         """Test creating select with list options."""
-        with Client() as client:
-            sel = ui.select(['Option 1', 'Option 2', 'Option 3'])
+        sel = ui.select(['Option 1', 'Option 2', 'Option 3'])
 
         assert sel.tag == "select"
         assert len(sel.options) == 3
         assert sel.options[0]["value"] == "Option 1"
 
-    def test_create_select_with_dict(self):
+    @pytest.mark.widgets_full
+    def test_create_select_with_dict(self, client):
         """Test creating select with dict options."""
-        with Client() as client:
-            sel = ui.select({1: 'One', 2: 'Two', 3: 'Three'})
+        sel = ui.select({1: 'One', 2: 'Two', 3: 'Three'})
 
         assert len(sel.options) == 3
         assert sel.options[0]["value"] == 1
         assert sel.options[0]["label"] == "One"
 
-    def test_select_value(self):
+    @pytest.mark.widgets_full
+    def test_select_value(self, client):
         """Test select value setting."""
-        with Client() as client:
-            sel = ui.select(['A', 'B', 'C'], value='B')
+        sel = ui.select(['A', 'B', 'C'], value='B')
 
         assert sel.value == 'B'
         assert sel.display_value == 'B'
 
-    def test_select_change_callback(self):
+    @pytest.mark.widgets_full
+    def test_select_change_callback(self, client):
         """Test select change callback."""
         values = []
-        with Client() as client:
-            sel = ui.select(['A', 'B', 'C'], on_change=lambda v: values.append(v))
+        sel = ui.select(['A', 'B', 'C'], on_change=lambda v: values.append(v))
 
         sel.value = 'C'
         assert values == ['C']
 
+    @pytest.mark.widgets_full
+    def test_select_display_value_uses_labels(self, client):
+        """Test display value maps values to labels, including multiple."""
+        sel = ui.select({1: 'One', 2: 'Two', 3: 'Three'}, value=2)
+        multi = ui.select({1: 'One', 2: 'Two', 3: 'Three'}, value=[3, 1], multiple=True)
+
+        assert sel.display_value == 'Two'
+        assert multi.display_value == 'Three, One'
+
+        sel.set_options(['x', 'y'])
+        assert sel.display_value == '2'
+
 
 class TestRadio:
     """Tests for radio button component."""
 
-    def test_create_radio(self):
+    def test_create_radio(self, client):
         """Test creating radio group."""
-        with Client() as client:
-            radio = ui.radio(['Small', 'Medium', 'Large'])
+        radio = ui.radio(['Small', 'Medium', 'Large'])
 
         assert radio.tag == "radio"
         assert len(radio.options) == 3
 
-    def test_radio_value(self):
+    @pytest.mark.widgets_full
+    def test_radio_value(self, client):
         """Test radio value."""
-        with Client() as client:
-            radio = ui.radio(['A', 'B', 'C'], value='B')
+        radio = ui.radio(['A', 'B', 'C'], value='B')
 
         assert radio.value == 'B'
 
-    def test_radio_navigation(self):
+    @pytest.mark.widgets_full
+    def test_radio_navigation(self, client):
         """Test radio next/prev navigation."""
-        with Client() as client:
-            radio = ui.radio(['A', 'B', 'C'], value='A')
+        radio = ui.radio(['A', 'B', 'C'], value='A')
 
         radio.next()
         assert radio.value == 'B'
@@ -115,43 +136,43 @@ class TestRadio:
 class TestProgress:
     """Tests for progress bar component."""
 
-    def test_create_progress(self):
+    def test_create_progress(self, client):
         """Test creating progress bar."""
-        with Client() as client:
-            prog = ui.progress(0.5)
+        prog = ui.progress(0.5)
 
         assert prog.tag == "progress"
         assert prog.value == 0.5
         assert prog.percentage == 50
 
-    def test_progress_bounds(self):
-        """Test progress value bounds."""
-        with Client() as client:
-            prog = ui.progress(1.5)
+    @pytest.mark.widgets_full
+    @pytest.mark.parametrize("value, expected", [(1.5, 1.0), (-0.5, 0.0)])
+    def test_progress_bounds(self, client, value, expected):
+        """Test progress values are clamped on creation and assignment."""
+        prog = ui.progress(value)
 
-        assert prog.value == 1.0  # Clamped to max
+        assert prog.value == expected
 
-        prog.value = -0.5
-        assert prog.value == 0.0  # Clamped to min
+        prog.value = 0.5
+        prog.value = value
+        assert prog.value == expected
 
 
 class TestSlider:
     """Tests for slider component."""
 
-    def test_create_slider(self):
+    def test_create_slider(self, client):
         """Test creating slider."""
-        with Client() as client:
-            slider = ui.slider(min=0, max=100, value=50)
+        slider = ui.slider(min=0, max=100, value=50)
 
         assert slider.tag == "slider"
         assert slider.value == 50
         assert slider.min == 0
         assert slider.max == 100
 
-    def test_slider_increment_decrement(self):
+    @pytest.mark.widgets_full
+    def test_slider_increment_decrement(self, client):
         """Test slider increment/decrement."""
-        with Client() as client:
-            slider = ui.slider(min=0, max=10, step=1, value=5)
+        slider = ui.slider(min=0, max=10, step=1, value=5)
 
         slider.increment()
         assert slider.value == 6
@@ -163,19 +184,17 @@ class TestSlider:
 class TestToggle:
     """Tests for toggle/switch component."""
 
-    def test_create_toggle(self):
+    def test_create_toggle(self, client):
         """Test creating toggle."""
-        with Client() as client:
-            toggle = ui.toggle("Dark mode", value=False)
+        toggle = ui.toggle("Dark mode", value=False)
 
         assert toggle.tag == "toggle"
         assert toggle.value is False
         assert toggle.text == "Dark mode"
 
-    def test_toggle_switch(self):
+    def test_toggle_switch(self, client):
         """Test toggling."""
-        with Client() as client:
-            toggle = ui.toggle("Test")
+        toggle = ui.toggle("Test")
 
         assert toggle.value is False
         toggle.toggle()
@@ -187,12 +206,11 @@ class TestToggle:
 class TestTabs:
     """Tests for tabs component."""
 
-    def test_create_tabs(self):
+    def test_create_tabs(self, client):
         """Test creating tabs."""
-        with Client() as client:
-            with ui.tabs() as tabs:
-                tab1 = ui.tab('Home')
-                tab2 = ui.tab('Settings')
+        with ui.tabs() as tabs:
+            tab1 = ui.tab('Home')
+            tab2 = ui.tab('Settings')
 
         assert tabs.tag == "tabs"
         # Verify tabs were created
@@ -201,12 +219,11 @@ class TestTabs:
         assert tab1.name == "Home"
         assert tab2.name == "Settings"
 
-    def test_tabs_value(self):
+    def test_tabs_value(self, client):
         """Test tabs value (selected tab)."""
-        with Client() as client:
-            with ui.tabs(value='Settings') as tabs:
-                ui.tab('Home')
-                ui.tab('Settings')
+        with ui.tabs(value='Settings') as tabs:
+            ui.tab('Home')
+            ui.tab('Settings')
 
         assert tabs.value == 'Settings'
 
@@ -214,7 +231,7 @@ class TestTabs:
 class TestTable:
     """Tests for table component."""
 
-    def test_create_table(self):
+    def test_create_table(self, client):
         """Test creating table."""
         columns = [
             {'name': 'name', 'label': 'Name', 'field': 'name'},
@@ -225,20 +242,19 @@ class TestTable:
             {'name': 'Bob', 'age': 25},
         ]
 
-        with Client() as client:
-            table = ui.table(columns=columns, rows=rows, row_key='name')
+        table = ui.table(columns=columns, rows=rows, row_key='name')
 
         assert table.tag == "table"
         assert len(table.rows) == 2
         assert len(table.columns) == 2
 
-    def test_table_selection(self):
+    @pytest.mark.widgets_full
+    def test_table_selection(self, client):
         """Test table row selection."""
         columns = [{'name': 'id', 'label': 'ID', 'field': 'id'}]
         rows = [{'id': 1}, {'id': 2}, {'id': 3}]
 
-        with Client() as client:
-            table = ui.table(columns=columns, rows=rows, row_key='id', selection='single')
+        table = ui.table(columns=columns, rows=rows, row_key='id', selection='single')
 
         table.select(2)
         assert len(table.selected) == 1
@@ -248,61 +264,67 @@ class TestTable:
 class TestSeparator:
     """Tests for separator component."""
 
-    def test_create_separator(self):
+    def test_create_separator(self, client):
         """Test creating separator."""
-        with Client() as client:
-            sep = ui.separator()
+        sep = ui.separator()
 
         assert sep.tag == "separator"
         assert sep.vertical is False
 
-    def test_vertical_separator(self):
+    def test_vertical_separator(self, client):
         """Test vertical separator."""
-        with Client() as client:
-            sep = ui.separator(vertical=True)
+        sep = ui.separator(vertical=True)
 
         assert sep.vertical is True
+        assert sep.char == "|"
+
+    def test_default_separator_shares_class_defaults(self, client):
+        """Test default separators and spaces keep no per-instance copies."""
+        sep = ui.separator()
+        custom = ui.separator(char="=")
+        space = ui.space()
+
+        assert sep.char == "-"
+        assert "char" not in vars(sep)
+        assert custom.char == "="
+        assert (space.width, space.height) == (1, 1)
+        assert "width" not in vars(space)
 
 
 class TestNumber:
     """Tests for number input component."""
 
-    def test_create_number(self):
+    def test_create_number(self, client):
         """Test creating number input."""
-        with Client() as client:
-            num = ui.number(label="Age", value=25, min=0, max=120)
+        num = ui.number(label="Age", value=25, min=0, max=120)
 
         assert num.tag == "number"
         assert num.value == 25
 
-    def test_number_bounds(self):
-        """Test number value bounds."""
-        with Client() as client:
-            num = ui.number(min=0, max=100, value=50)
+    @pytest.mark.widgets_full
+    @pytest.mark.parametrize("value, expected", [(150, 100), (-50, 0)])
+    def test_number_bounds(self, client, value, expected):
+        """Test number values are clamped to min/max."""
+        num = ui.number(min=0, max=100, value=50)
 
-        num.value = 150
-        assert num.value == 100  # Clamped
-
-        num.value = -50
-        assert num.value == 0  # Clamped
+        num.value = value
+        assert num.value == expected
 
 
 class TestTextarea:
     """Tests for textarea component."""
 
-    def test_create_textarea(self):
+    def test_create_textarea(self, client):
         """Test creating textarea."""
-        with Client() as client:
-            ta = ui.textarea(label="Description", value="Initial text")
+        ta = ui.textarea(label="Description", value="Initial text")
 
         assert ta.tag == "textarea"
         assert ta.value == "Initial text"
         assert ta.line_count == 1
 
-    def test_textarea_multiline(self):
+    def test_textarea_multiline(self, client):
         """Test textarea with multiline content."""
-        with Client() as client:
-            ta = ui.textarea(value="Line 1\nLine 2\nLine 3")
+        ta = ui.textarea(value="Line 1\nLine 2\nLine 3")
 
         assert ta.line_count == 3
 
@@ -310,19 +332,18 @@ class TestTextarea:
 class TestTree:
     """Tests for tree component."""
 
-    def test_create_tree(self):
+    def test_create_tree(self, client):
         """Test creating tree."""
         nodes = [
             {'id': '1', 'label': 'Root'},
         ]
 
-        with Client() as client:
-            tree = ui.tree(nodes)
+        tree = ui.tree(nodes)
 
         assert tree.tag == "tree"
         assert len(tree.nodes) == 1
 
-    def test_tree_expand_collapse(self):
+    def test_tree_expand_collapse(self, client):
         """Test tree expand/collapse."""
         nodes = [
             {'id': '1', 'label': 'Root', 'children': [
@@ -330,8 +351,7 @@ class TestTree:
             ]},
         ]
 
-        with Client() as client:
-            tree = ui.tree(nodes)
+        tree = ui.tree(nodes)
 
         tree.expand('1')
         assert '1' in tree._expanded
@@ -343,69 +363,56 @@ class TestTree:
 class TestRendering:
     """Tests for rendering new components."""
 
-    def test_render_toggle(self):
+    def test_render_toggle(self, client, renderer):
         """Test toggle renders correctly."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            toggle = ui.toggle("Dark mode", value=True)
+        toggle = ui.toggle("Dark mode", value=True)
 
         output = renderer.render(toggle)
         assert "Dark mode" in output
         assert "(*)" in output  # ON indicator
 
-    def test_render_progress(self):
+    def test_render_progress(self, client, renderer):
         """Test progress bar renders correctly."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            prog = ui.progress(0.5, show_value=True)
+        prog = ui.progress(0.5, show_value=True)
 
         output = renderer.render(prog)
         assert "50%" in output
         assert "=" in output  # Progress bar fill
 
-    def test_render_slider(self):
+    def test_render_slider(self, client, renderer):
         """Test slider renders correctly."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            slider = ui.slider(min=0, max=1, value=0.5)
+        slider = ui.slider(min=0, max=1, value=0.5)
 
         output = renderer.render(slider)
-        assert "O" in output  # Handle
-        assert "-" in output  # Track
+        assert _has_all(output, ["O", "-"])  # Handle and track
 
-    def test_render_select(self):
+    def test_render_select(self, client, renderer):
         """Test select renders correctly."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            sel = ui.select(['A', 'B', 'C'], value='B')
+        sel = ui.select(['A', 'B', 'C'], value='B')
 
         output = renderer.render(sel)
         assert "B" in output
-        assert "v" in output or "^" in output  # Dropdown indicator
+        assert _DROPDOWN_INDICATOR.search(output)
 
-    def test_render_radio(self):
+    def test_render_radio(self, client, renderer):
         """Test radio renders correctly."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            radio = ui.radio(['A', 'B', 'C'], value='B')
+        radio = ui.radio(['A', 'B', 'C'], value='B')
 
         output = renderer.render(radio)
-        assert "A" in output
-        assert "B" in output
-        assert "C" in output
-        assert "(*)" in output  # Selected marker
+        assert _has_all(output, ["A", "B", "C", "(*)"])  # (*) marks selected
 
-    def test_render_badge(self):
+    def test_render_badge(self, client, renderer):
         """Test badge renders correctly."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            badge = ui.badge("NEW")
+        badge = ui.badge("NEW")
 
         output = renderer.render(badge)
         assert "NEW" in output
+
+
+class TestNativeWidget:
+    """Tests for native widget placeholder."""
+
+    def test_requires_widget_factory(self, client):
+        """Test a missing factory is rejected at construction."""
+        with pytest.raises(TypeError):
+            ui.native_widget(None)
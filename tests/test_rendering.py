@@ -1,79 +1,78 @@
 """Tests for terminal rendering functionality."""
 
+import re
+import weakref
+
 import pytest
 from rawgui import ui
-from rawgui.client import Client
-from rawgui.renderer.terminal import TerminalRenderer
-from rawgui.renderer.styles import StyleMapper, TerminalStyle
-
+from rawgui.renderer.styles import TerminalStyle
 
-class TestStyleMapper:
-    """Tests for style mapping."""
 
-    def test_text_bold_class(self):
-        """Test text-bold class is recognized."""
-        mapper = StyleMapper()
-        style = mapper.map_classes(["text-bold"])
-        assert style.bold is True
+pytestmark = pytest.mark.xdist_group("unit")
 
-    def test_font_bold_class(self):
-        """Test font-bold class is recognized."""
-        mapper = StyleMapper()
-        style = mapper.map_classes(["font-bold"])
-        assert style.bold is True
+# Horizontal or vertical card border, found in one scan of the output
+_BORDER_LINE = re.compile("[─│]")
 
-    def test_padding_all_sides(self):
-        """Test p-2 applies padding to all sides."""
-        mapper = StyleMapper()
-        style = mapper.map_classes(["p-2"])
-        assert style.padding_top == 2
-        assert style.padding_right == 2
-        assert style.padding_bottom == 2
-        assert style.padding_left == 2
 
-    def test_padding_x(self):
-        """Test px-4 applies horizontal padding."""
-        mapper = StyleMapper()
-        style = mapper.map_classes(["px-4"])
-        assert style.padding_left == 4
-        assert style.padding_right == 4
-        assert style.padding_top == 0
-        assert style.padding_bottom == 0
-
-    def test_gap_class(self):
-        """Test gap-2 is parsed correctly."""
-        mapper = StyleMapper()
-        style = mapper.map_classes(["gap-2"])
-        assert style.gap == 2
-
-    def test_text_color_simple(self):
-        """Test text-red sets foreground color."""
-        mapper = StyleMapper()
-        style = mapper.map_classes(["text-red"])
-        assert style.fg_color == "red"
-
-    def test_text_color_with_shade(self):
-        """Test text-red-500 sets foreground color."""
-        mapper = StyleMapper()
-        style = mapper.map_classes(["text-red-500"])
-        assert style.fg_color == "red"
+class TestStyleMapper:
+    """Tests for style mapping."""
 
-    def test_bg_color(self):
-        """Test bg-blue sets background color."""
-        mapper = StyleMapper()
-        style = mapper.map_classes(["bg-blue"])
-        assert style.bg_color == "blue"
+    @pytest.mark.parametrize(
+        "cls, attr, expected",
+        [
+            ("text-bold", "bold", True),
+            ("font-bold", "bold", True),
+            ("gap-2", "gap", 2),
+            ("text-red", "fg_color", "red"),
+            ("text-red-500", "fg_color", "red"),
+            ("bg-blue", "bg_color", "blue"),
+            ("border", "border", True),
+        ],
+    )
+    def test_single_class(self, style_mapper, cls, attr, expected):
+        """Test a single class sets its style attribute."""
+        style = style_mapper.map_classes([cls])
+        assert getattr(style, attr) == expected
+
+    @pytest.mark.parametrize(
+        "cls, top, right, bottom, left",
+        [
+            ("p-2", 2, 2, 2, 2),
+            ("px-4", 0, 4, 0, 4),
+        ],
+    )
+    def test_padding(self, style_mapper, cls, top, right, bottom, left):
+        """Test padding classes apply to the expected sides."""
+        style = style_mapper.map_classes([cls])
+        sides = (
+            style.padding_top,
+            style.padding_right,
+            style.padding_bottom,
+            style.padding_left,
+        )
+        assert sides == (top, right, bottom, left)
+
+    def test_later_class_overrides_earlier(self, style_mapper):
+        """Test cached class results are applied in class order."""
+        style_mapper.map_classes(["px-0"])
+        style = style_mapper.map_classes(["p-2", "px-0"])
+        assert (style.padding_top, style.padding_left) == (2, 0)
+        style = style_mapper.map_classes(["px-0", "p-2"])
+        assert (style.padding_top, style.padding_left) == (2, 2)
+
+    def test_mapper_freed_without_cycle_collection(self):
+        """Test the class cache does not keep its StyleMapper alive."""
+        from rawgui.renderer.styles import StyleMapper
 
-    def test_border_class(self):
-        """Test border class."""
         mapper = StyleMapper()
-        style = mapper.map_classes(["border"])
-        assert style.border is True
+        mapper.map_classes(["p-2", "text-red"])
+        ref = weakref.ref(mapper)
+        del mapper
+        assert ref() is None
 
-    def test_multiple_classes(self):
+    def test_multiple_classes(self, style_mapper):
         """Test multiple classes combined."""
-        mapper = StyleMapper()
-        style = mapper.map_classes(["text-bold", "text-red", "p-2", "gap-1"])
+        style = style_mapper.map_classes(["text-bold", "text-red", "p-2", "gap-1"])
         assert style.bold is True
         assert style.fg_color == "red"
         assert style.padding_top == 2
@@ -83,76 +82,58 @@ class TestStyleMapper:
 class TestTerminalRenderer:
     """Tests for terminal renderer."""
 
-    def test_render_label(self):
+    def test_render_label(self, client, renderer):
         """Test rendering a simple label."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            label = ui.label("Hello World")
+        label = ui.label("Hello World")
 
         output = renderer.render(label)
         assert "Hello World" in output
 
-    def test_render_button(self):
+    def test_render_button(self, client, renderer):
         """Test rendering a button with inline bracket style."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            btn = ui.button("Click Me")
+        btn = ui.button("Click Me")
 
         output = renderer.render(btn)
         assert "Click Me" in output
         # Button uses inline brackets: [ text ]
         assert "[ Click Me ]" in output
 
-    def test_render_column_with_children(self):
+    def test_render_column_with_children(self, client, renderer):
         """Test rendering a column with children."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            with ui.column() as col:
-                ui.label("Line 1")
-                ui.label("Line 2")
+        with ui.column() as col:
+            ui.label("Line 1")
+            ui.label("Line 2")
 
         output = renderer.render(col)
         assert "Line 1" in output
         assert "Line 2" in output
 
-    def test_render_row_with_children(self):
+    def test_render_row_with_children(self, client, renderer):
         """Test rendering a row with children."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            with ui.row() as row:
-                ui.label("Left")
-                ui.label("Right")
+        with ui.row() as row:
+            ui.label("Left")
+            ui.label("Right")
 
         output = renderer.render(row)
         assert "Left" in output
         assert "Right" in output
 
-    def test_render_card(self):
+    def test_render_card(self, client, renderer):
         """Test rendering a card with border."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            with ui.card() as card:
-                ui.label("Card Content")
+        with ui.card() as card:
+            ui.label("Card Content")
 
         output = renderer.render(card)
         assert "Card Content" in output
         # Check for border characters
-        assert "─" in output or "│" in output  # Border chars
+        assert _BORDER_LINE.search(output)
 
-    def test_focus_tracking(self):
+    def test_focus_tracking(self, client, renderer):
         """Test that focusable elements are tracked."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            with ui.column() as col:
-                btn1 = ui.button("Button 1")
-                btn2 = ui.button("Button 2")
-                inp = ui.input(label="Input")
+        with ui.column() as col:
+            btn1 = ui.button("Button 1")
+            btn2 = ui.button("Button 2")
+            inp = ui.input(label="Input")
 
         renderer.render(col)
 
@@ -162,14 +143,11 @@ class TestTerminalRenderer:
         assert btn2 in renderer._focusable
         assert inp in renderer._focusable
 
-    def test_focus_navigation(self):
+    def test_focus_navigation(self, client, renderer):
         """Test Tab navigation between elements."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            with ui.column() as col:
-                btn1 = ui.button("Button 1")
-                btn2 = ui.button("Button 2")
+        with ui.column() as col:
+            btn1 = ui.button("Button 1")
+            btn2 = ui.button("Button 2")
 
         renderer.render(col)
 
@@ -188,46 +166,47 @@ class TestTerminalRenderer:
         renderer.focus_prev()
         assert renderer.focused == btn2
 
+    def test_render_changes_rewrites_changed_cells(self, client, renderer):
+        """Test only cells that changed are written after the first frame."""
+        with ui.column() as col:
+            ui.label("Header")
+            status = ui.label("Before")
+
+        assert "Header" in renderer.render_changes(col)
+        assert renderer.render_changes(col) == ""
+
+        status.text = "After"
+        update = renderer.render_changes(col)
+        assert update.strip() == "After"
+
 
 class TestInputElement:
     """Tests for input element rendering and interaction."""
 
-    def test_input_with_label(self):
+    def test_input_with_label(self, client, renderer):
         """Test input renders with label."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            inp = ui.input(label="Name")
+        inp = ui.input(label="Name")
 
         output = renderer.render(inp)
         assert "Name" in output
 
-    def test_input_with_value(self):
+    def test_input_with_value(self, client, renderer):
         """Test input displays value."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            inp = ui.input(value="test value")
+        inp = ui.input(value="test value")
 
         output = renderer.render(inp)
         assert "test value" in output
 
-    def test_input_with_placeholder(self):
+    def test_input_with_placeholder(self, client, renderer):
         """Test input shows placeholder when empty."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            inp = ui.input(placeholder="Enter text...")
+        inp = ui.input(placeholder="Enter text...")
 
         output = renderer.render(inp)
         assert "Enter text..." in output
 
-    def test_password_input_masks_value(self):
+    def test_password_input_masks_value(self, client, renderer):
         """Test password input masks the value."""
-        renderer = TerminalRenderer()
-
-        with Client() as client:
-            inp = ui.input(value="secret", password=True)
+        inp = ui.input(value="secret", password=True)
 
         output = renderer.render(inp)
         assert "secret" not in output
@@ -237,34 +216,53 @@ class TestInputElement:
 class TestElementInteraction:
     """Tests for element event handling."""
 
-    def test_button_click_fires_event(self):
+    def test_button_click_fires_event(self, client):
         """Test button click triggers handler."""
         clicked = []
 
-        with Client() as client:
-            btn = ui.button("Click", on_click=lambda: clicked.append(True))
+        btn = ui.button("Click", on_click=lambda: clicked.append(True))
 
         btn._fire_event("click")
         assert clicked == [True]
 
-    def test_input_change_fires_event(self):
+    def test_input_change_fires_event(self, client):
         """Test input change triggers handler."""
         values = []
 
-        with Client() as client:
-            inp = ui.input(on_change=lambda v: values.append(v))
+        inp = ui.input(on_change=lambda v: values.append(v))
 
         inp.value = "new value"
         inp._fire_event("change", "new value")
         assert values == ["new value"]
 
-    def test_disabled_button_styling(self):
-        """Test disabled button has different style."""
-        renderer = TerminalRenderer()
+    def test_batched_events_fire_once(self, client):
+        """Test events inside a batch fire once with the latest value."""
+        values = []
+
+        num = ui.number(value=1).on("change", values.append)
+
+        with client.batch():
+            num.value = 2
+            num.value = 3
+            assert values == []
+        assert values == [3]
 
-        with Client() as client:
-            btn = ui.button("Disabled")
-            btn.disable()
+    def test_batched_on_change_callback_fires_once(self, client):
+        """Test a constructor on_change callback is batched like events."""
+        values = []
+
+        slider = ui.slider(min=0, max=10, value=5, on_change=values.append)
+
+        with client.batch():
+            slider.value = 6
+            slider.value = 7
+            assert values == []
+        assert values == [7]
+
+    def test_disabled_button_styling(self, client, renderer):
+        """Test disabled button has different style."""
+        btn = ui.button("Disabled")
+        btn.disable()
 
         output = renderer.render(btn)
         assert "Disabled" in output
@@ -1,11 +1,19 @@
 """Tests for SubprocessTerminal testing utility."""
 
+import shutil
+import time
+
 import pytest
 from pathlib import Path
 
 from rawgui.testing import SubprocessTerminal, run_terminal_test
 
 
+# Resolved once, so spawning skips the PATH lookup
+_ECHO = shutil.which("echo")
+_CAT = shutil.which("cat")
+
+
 class TestSubprocessTerminal:
     """Tests for SubprocessTerminal class."""
 
@@ -17,33 +25,151 @@ class TestSubprocessTerminal:
 
     def test_run_simple_command(self):
         """Test running a simple command."""
-        with SubprocessTerminal("echo 'Hello World'") as term:
+        with SubprocessTerminal([_ECHO, "Hello World"]) as term:
             term.wait_for_text("Hello World", timeout=5)
             assert term.contains("Hello World")
 
     def test_find_text(self):
         """Test finding text positions."""
-        with SubprocessTerminal("echo 'Test Line'") as term:
+        with SubprocessTerminal([_ECHO, "Test Line"]) as term:
             term.wait_for_text("Test", timeout=5)
             positions = term.find_text("Test")
             assert len(positions) >= 1
+            assert term.find_pattern(r"Line\s+$") == [(0, 5, "Line" + " " * 71)]
 
-    def test_send_keys(self):
-        """Test sending keystrokes."""
-        # Use cat to echo input
-        with SubprocessTerminal("cat") as term:
-            term.send_text("hello")
-            term.wait_for_text("hello", timeout=5)
-            assert term.contains("hello")
+    def test_contains_all(self):
+        """Test checking several texts against one screen read."""
+        with SubprocessTerminal([_ECHO, "Alpha Beta"]) as term:
+            term.wait_for_text("Alpha", timeout=5)
+            assert term.contains_all(["Alpha", "Beta"])
+            assert not term.contains_all(["Alpha", "Gamma"])
+
+    def test_text_follows_scrolling(self):
+        """Test cached row text is refreshed when the screen scrolls."""
+        with SubprocessTerminal("seq 30", rows=24) as term:
+            term.wait_for_text("30", timeout=5)
+            assert term.get_line(0) == "8"  # the final newline scrolls too
+            assert term.get_text().splitlines()[-1] == "30"
 
     def test_screenshot(self, tmp_path):
         """Test taking a screenshot."""
-        with SubprocessTerminal("echo 'Screenshot Test'") as term:
+        with SubprocessTerminal([_ECHO, "Screenshot Test"]) as term:
             term.wait_for_text("Screenshot", timeout=5)
             path = term.screenshot(tmp_path / "test.png")
             assert path.exists()
             assert path.suffix == ".png"
 
+    def test_screenshot_bytes(self):
+        """Test rendering a screenshot to PNG data without a file."""
+        with SubprocessTerminal([_ECHO, "Screenshot Test"]) as term:
+            term.wait_for_text("Screenshot", timeout=5)
+            assert term.screenshot_bytes()[:8] == b"\x89PNG\r\n\x1a\n"
+
+    def test_timeout_follows_injected_clock(self):
+        """Test a wait times out on the injected clock, not wall time."""
+        ticks = iter(range(0, 1000, 10))
+        with SubprocessTerminal([_CAT], clock=lambda: next(ticks)) as term:
+            start = time.monotonic()
+            assert not term.wait_for_text("never printed", timeout=5)
+            assert time.monotonic() - start < 1
+
+
+@pytest.fixture(scope="class")
+def cat_term():
+    """A ``cat`` terminal started once per test class."""
+    with SubprocessTerminal([_CAT]) as term:
+        yield term
+
+
+# One worker, so the class-scoped cat process is started only once
+@pytest.mark.xdist_group("cat")
+class TestSubprocessTerminalWithCat:
+    """Tests that share one long-running ``cat`` process."""
+
+    @pytest.fixture
+    def term(self, cat_term):
+        """The shared ``cat`` terminal with an empty line and screen."""
+        cat_term.send_keys("\x15", delay=0)  # Ctrl+U drops unsent input
+        cat_term.wait_for_idle()
+        cat_term.clear_screen()
+        return cat_term
+
+    def test_send_keys(self, term):
+        """Test sending keystrokes."""
+        term.send_text("hello")
+        term.wait_for_text("hello", timeout=5)
+        assert term.contains("hello")
+
+    def test_clear_screen(self, term):
+        """Test clearing drops earlier output from the screen."""
+        term.send_text("stale")
+        assert term.wait_for_text("stale", timeout=5)
+        term.clear_screen()
+        assert not term.contains("stale")
+
+    def test_wait_for_idle(self, term):
+        """Test waiting for output to settle returns before the timeout."""
+        start = time.monotonic()
+        assert term.wait_for_idle(timeout=5)
+        assert time.monotonic() - start < 1
+
+    def test_identical_screens_reuse_screenshot(self, term, tmp_path, monkeypatch):
+        """Test an identical screen is neither hashed nor rendered again."""
+        calls = {"digest": 0, "render": 0}
+
+        def counting(name, method):
+            def wrapper(*args, **kwargs):
+                calls[name] += 1
+                return method(*args, **kwargs)
+            return wrapper
+
+        monkeypatch.setattr(term, "_screen_digest", counting("digest", term._screen_digest))
+        monkeypatch.setattr(term, "_render_image", counting("render", term._render_image))
+
+        first = term.screenshot(tmp_path / "first.png")
+        seen = dict(calls)
+        second = term.screenshot(tmp_path / "second.png")
+        third = term.screenshot(tmp_path / "third.png")
+        assert second.read_bytes() == first.read_bytes() == third.read_bytes()
+        assert calls == seen
+
+        term.send_text("changed")
+        term.wait_for_text("changed", timeout=5)
+        term.screenshot(second)
+        assert second.read_bytes() != first.read_bytes()
+        assert calls == {"digest": seen["digest"] + 1, "render": seen["render"] + 1}
+
+    def test_reused_output_path_does_not_leak_into_cache(self, term, tmp_path):
+        """Test overwriting an output path leaves the cached shot intact."""
+        out = tmp_path / "out.png"
+        term.send_text("screen a")
+        assert term.wait_for_text("screen a", timeout=5)
+        screen_a = term.screenshot(out).read_bytes()
+
+        term.clear_screen()
+        term.send_text("screen b")
+        assert term.wait_for_text("screen b", timeout=5)
+        term.screenshot(out)
+
+        term.clear_screen()
+        term.send_text("screen a")
+        assert term.wait_for_text("screen a", timeout=5)
+        assert term.screenshot(tmp_path / "again.png").read_bytes() == screen_a
+        assert term.screenshot_bytes() == screen_a
+        assert out.read_bytes() != screen_a
+
+    def test_writing_to_output_file_does_not_leak_into_cache(self, term, tmp_path):
+        """Test in-place writes to a returned screenshot leave the cache intact."""
+        term.send_text("screen c")
+        assert term.wait_for_text("screen c", timeout=5)
+        out = term.screenshot(tmp_path / "out.png")
+        shot = out.read_bytes()
+        with open(out, "wb") as f:
+            f.write(b"annotated")
+
+        assert term.screenshot(tmp_path / "again.png").read_bytes() == shot
+        assert term.screenshot_bytes() == shot
+
 
 class TestRunTerminalTest:
     """Tests for run_terminal_test convenience function."""
@@ -51,7 +177,7 @@ class TestRunTerminalTest:
     def test_basic_test(self):
         """Test basic terminal test."""
         content = run_terminal_test(
-            "echo 'Hello Test'",
+            [_ECHO, "Hello Test"],
             [
                 ("wait", "Hello"),
                 ("delay", 0.1),
@@ -62,7 +188,7 @@ class TestRunTerminalTest:
     def test_with_assertions(self):
         """Test with assertions."""
         content = run_terminal_test(
-            "echo 'Expected Text'",
+            [_ECHO, "Expected Text"],
             [
                 ("wait", "Expected"),
                 ("assert", "Expected Text"),
@@ -75,9 +201,38 @@ class TestRunTerminalTest:
         """Test assertion failure raises error."""
         with pytest.raises(AssertionError):
             run_terminal_test(
-                "echo 'Actual'",
+                [_ECHO, "Actual"],
                 [
                     ("wait", "Actual"),
                     ("assert", "NotPresent"),
                 ],
             )
+
+
+class TestAppRunner:
+    """Tests for apps forked from the pre-warmed runner."""
+
+    def test_run_script_source(self, app_runner):
+        """Test the same source can be run repeatedly from its cached code."""
+        script = "print('forked ' + __name__)"
+        for _ in range(2):
+            with app_runner.run(script=script) as term:
+                assert term.wait_for_text("forked __main__", timeout=5)
+
+    def test_element_modules_are_prewarmed(self, app_runner):
+        """Test the lazily loaded element modules are imported before forking."""
+        script = "import sys; print('slider loaded', 'rawgui.elements.slider' in sys.modules)"
+        with app_runner.run(script=script) as term:
+            assert term.wait_for_text("slider loaded True", timeout=5)
+
+    def test_exit_message_is_printed(self, app_runner):
+        """Test a SystemExit message reaches stderr like in a normal interpreter."""
+        with app_runner.run(script="raise SystemExit('bye from app')") as term:
+            assert term.wait_for_text("bye from app", timeout=5)
+
+    def test_requires_path_or_script(self, app_runner):
+        """Test exactly one of path and script must be given."""
+        with pytest.raises(ValueError):
+            app_runner.run()
+        with pytest.raises(ValueError):
+            app_runner.run("app.py", script="pass")
@@ -101,6 +101,45 @@ class TestTabNavigation:
         # Note: _focusable list is rebuilt, but _focused should match
         assert renderer._focused == btn2 or renderer._focused.text == "Button 2"
 
+    def test_focus_leaves_replaced_page(self):
+        """Test focus does not keep an element of a replaced tree."""
+        renderer = TerminalRenderer()
+
+        with Client() as client:
+            with ui.column() as old_page:
+                ui.button("Old 1")
+                old_btn = ui.button("Old 2")
+            with ui.column() as new_page:
+                ui.button("New 1")
+                new_btn = ui.button("New 2")
+
+        renderer.render(old_page)
+        renderer.focus_element(old_btn)
+        renderer.set_hover(old_btn)
+
+        renderer.render(new_page)
+        assert renderer.focused is new_btn
+        assert renderer._hovered is None
+
+    def test_page_swap_leaves_edit_mode(self):
+        """Test edit mode ends when focus moves off a replaced input."""
+        renderer = TerminalRenderer()
+
+        with Client() as client:
+            with ui.column() as old_page:
+                old_input = ui.input("Name")
+            with ui.column() as new_page:
+                new_btn = ui.button("Save")
+
+        renderer.render(old_page)
+        renderer.focus_element(old_input)
+        renderer.enter_edit_mode()
+        assert renderer.edit_mode
+
+        renderer.render(new_page)
+        assert renderer.focused is new_btn
+        assert not renderer.edit_mode
+
     def test_disabled_elements_not_focusable(self):
         """Test that disabled elements cannot receive focus."""
         renderer = TerminalRenderer()
@@ -138,6 +177,24 @@ class TestTabNavigation:
         renderer.focus_next()
         assert renderer.focused == btn1
 
+    def test_focus_element_ignores_non_focusable(self):
+        """Test focusing an element outside the focus order is a no-op."""
+        renderer = TerminalRenderer()
+
+        with Client() as client:
+            with ui.column() as col:
+                label = ui.label("Not focusable")
+                btn1 = ui.button("Button 1")
+                btn2 = ui.button("Button 2")
+
+        renderer.render(col)
+        renderer.focus_element(btn2)
+        assert renderer.focus_index == 1
+
+        renderer.focus_element(label)
+        assert renderer.focused == btn2
+        assert renderer.focus_index == 1
+
     def test_no_focusable_elements(self):
         """Test handling when there are no focusable elements."""
         renderer = TerminalRenderer()
@@ -4,10 +4,13 @@ Tests click and keyboard interactions with the counter example
 using both TUI and Tkinter renderers.
 """
 
+import os
+
 import pytest
 from pathlib import Path
 
 from rawgui.testing import User, TkinterUser, TUIUser, compare_images
+from rawgui.testing.user import _load_rgb
 
 
 class TestTkinterUserInteraction:
@@ -119,6 +122,21 @@ class TestTkinterUserInteraction:
             are_equal, diff = compare_images(str(initial), str(after), threshold=0.0001)
             assert diff > 0, f"Screenshots should differ after increment (diff={diff})"
 
+    def test_unchanged_screenshot_not_rewritten(self, tmp_path):
+        """Test an identical frame does not rewrite the PNG."""
+        with User("examples/counter.py", renderer="tkinter") as user:
+            path = tmp_path / "shot.png"
+            user.screenshot(str(path))
+            initial = path.read_bytes()
+            os.utime(path, ns=(0, 0))
+
+            user.screenshot(str(path))
+            assert path.stat().st_mtime_ns == 0
+
+            user.click_element(user.find_by_text("+ Increment"))
+            user.screenshot(str(path))
+            assert path.read_bytes() != initial
+
     def test_arrow_key_navigation(self):
         """Test arrow keys navigate between buttons."""
         with User("examples/counter.py", renderer="tkinter") as user:
@@ -136,30 +154,126 @@ class TestTkinterUserInteraction:
             # Check counter incremented
             assert user.contains("Count: 1"), f"Navigation + space should increment. Got: {user.get_text()}"
 
-    def test_get_elements_returns_all(self):
-        """Test get_elements returns all rendered elements."""
+    def test_adapter_reused_across_sessions(self):
+        """Test a stopped session's adapter is reset and reused by the next."""
         with User("examples/counter.py", renderer="tkinter") as user:
-            elements = user.get_elements()
+            user.click_element(user.find_by_text("+ Increment"))
+            first_adapter = user._adapter
 
-            # Should have labels, buttons, etc.
-            tags = [el.tag for el in elements]
-            assert "label" in tags, "Should have labels"
-            assert "button" in tags, "Should have buttons"
+        with User("examples/counter.py", renderer="tkinter") as user:
+            assert user._adapter is first_adapter
+            assert user.contains("Count: 0")
+            assert user._adapter.focused.text == "- Decrement"
+
+    def test_script_entry_points_are_stripped(self, tmp_path):
+        """Test main guards and ui.run() calls are not executed."""
+        script = tmp_path / "app.py"
+        script.write_text(
+            "from rawgui import ui\n"
+            "\n"
+            "@ui.page('/')\n"
+            "def index():\n"
+            "    ui.label('Stripped OK')\n"
+            "\n"
+            "ui.run (reload=False)\n"
+            "if __name__ in {'__main__', '__mp_main__'}:\n"
+            "    raise SystemExit('main guard executed')\n"
+        )
+        with User(str(script), renderer="tkinter") as user:
+            assert user.contains("Stripped OK")
+
+    def test_no_pixels_mode(self):
+        """Test structural queries work without pixel rendering."""
+        with User("examples/counter.py", renderer="tkinter", no_pixels=True) as user:
+            assert user.contains("Count: 0")
+            user.click_element(user.find_by_text("+ Increment"))
+            assert user.contains("Count: 1")
 
-            # Find specific elements
-            buttons = user.find_by_tag("button")
-            assert len(buttons) == 3, f"Should have 3 buttons. Got {len(buttons)}"
+            with pytest.raises(RuntimeError, match="pixel rendering disabled"):
+                user.get_image()
 
-    def test_element_coordinates(self):
-        """Test elements have valid coordinates."""
-        with User("examples/counter.py", renderer="tkinter") as user:
-            elements = user.get_elements()
 
-            for el in elements:
-                assert el.x >= 0, f"Element {el.tag} has negative x"
-                assert el.y >= 0, f"Element {el.tag} has negative y"
-                assert el.width > 0, f"Element {el.tag} has zero width"
-                assert el.height > 0, f"Element {el.tag} has zero height"
+@pytest.fixture(scope="class")
+def user():
+    """A counter app session started once per class; tests must not interact with it."""
+    with User("examples/counter.py", renderer="tkinter") as user:
+        yield user
+
+
+class TestTkinterUserQueries:
+    """Read-only queries, sharing one Tkinter session for the class."""
+
+    def test_get_elements_returns_all(self, user):
+        """Test get_elements returns all rendered elements."""
+        elements = user.get_elements()
+
+        # Should have labels, buttons, etc.
+        tags = [el.tag for el in elements]
+        assert "label" in tags, "Should have labels"
+        assert "button" in tags, "Should have buttons"
+
+        # Find specific elements
+        buttons = user.find_by_tag("button")
+        assert len(buttons) == 3, f"Should have 3 buttons. Got {len(buttons)}"
+
+    def test_element_coordinates(self, user):
+        """Test elements have valid coordinates."""
+        elements = user.get_elements()
+
+        for el in elements:
+            assert el.x >= 0, f"Element {el.tag} has negative x"
+            assert el.y >= 0, f"Element {el.tag} has negative y"
+            assert el.width > 0, f"Element {el.tag} has zero width"
+            assert el.height > 0, f"Element {el.tag} has zero height"
+
+    def test_element_info_is_slotted(self, user):
+        """Test ElementInfo carries no per-instance dict and tags are interned."""
+        buttons = user.find_by_tag("button")
+        assert not hasattr(buttons[0], "__dict__")
+        assert all(btn.tag is buttons[0].tag for btn in buttons)
+
+    def test_find_by_text_matches_element_scan(self, user):
+        """Test joined-text search agrees with a per-element scan."""
+        for query in ["Count", "Increment", "- Dec", "Reset", "nope"]:
+            expected = next((el for el in user.get_elements() if query in el.text), None)
+            assert user.find_by_text(query) is expected
+        assert user.contains("Count: 0")
+        assert not user.contains("Count: 99")
+
+    def test_compare_images_decodes_each_file_once(self, user, tmp_path):
+        """Test repeated comparisons against a baseline reuse its decode."""
+        baseline = tmp_path / "baseline.png"
+        user.screenshot(str(baseline))
+
+        assert compare_images(str(baseline), str(baseline)) == (True, 0.0)
+        hits = _load_rgb.cache_info().hits
+        assert compare_images(str(baseline), str(baseline)) == (True, 0.0)
+        assert _load_rgb.cache_info().hits == hits + 2
+
+    def test_find_by_tag_matches_element_scan(self, user):
+        """Test the per-tag index agrees with a per-element scan."""
+        for tag in ["button", "label", "nope"]:
+            assert user.find_by_tag(tag) == [el for el in user.get_elements() if el.tag == tag]
+
+    def test_element_at_matches_adapter_hit_test(self, user):
+        """Test the hit grid finds the same element as the adapter."""
+        for btn in user.find_by_tag("button"):
+            cx, cy = btn.center
+            assert user.element_at(cx, cy) is btn.element
+            assert user._adapter.get_element_at(cx, cy) is btn.element
+
+        assert user.element_at(-100, -100) is None
+
+    def test_element_at_includes_right_and_bottom_edges(self, user):
+        """Test the hit grid treats element edges like the adapter does."""
+        for btn in user.find_by_tag("button"):
+            for x, y in [
+                (btn.x, btn.y),
+                (btn.x + btn.width, btn.y + btn.height),
+                (btn.x + btn.width + 1, btn.y + btn.height + 1),
+            ]:
+                assert user.element_at(x, y) is user._adapter.get_element_at(x, y)
+            assert user.element_at(btn.x + btn.width, btn.y + btn.height) is btn.element
 
 
 class TestTUIUserInteraction:
@@ -185,12 +299,8 @@ class TestTUIUserInteraction:
             # Press space to activate (increment)
             user.press_key("space")
 
-            # Wait for re-render
-            import time
-            time.sleep(0.5)
-
-            # Check counter updated
-            assert user.contains("Count: 1"), f"TUI should show Count: 1. Got: {user.get_text()}"
+            # Check counter updated, as soon as it is re-rendered
+            assert user.wait_for_text("Count: 1", timeout=2.0), f"TUI should show Count: 1. Got: {user.get_text()}"
 
     def test_tui_screenshot(self, tmp_path):
         """Test TUI screenshot capture."""
@@ -234,6 +344,4 @@ class TestCrossRendererParity:
             user.press_key("tab")
             user.press_key("tab")
             user.press_key("space")
-            import time
-            time.sleep(0.5)
-            assert user.contains("Count: 1"), f"TUI count wrong: {user.get_text()}"
+            assert user.wait_for_text("Count: 1", timeout=2.0), f"TUI count wrong: {user.get_text()}"
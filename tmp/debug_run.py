@@ -7,6 +7,17 @@ from blessed import Terminal
 
 term = Terminal()
 
+# Keys that end the session, by key string and by key name
+EXIT_KEYS = {"\x03": "Ctrl+C", "\x1b": "Escape", "q": "'q'"}
+EXIT_KEY_NAMES = {"KEY_ESCAPE": "Escape"}
+
+def show(lines):
+    """Redraw the screen with one line per row in a single write."""
+    frame = term.clear + "".join(term.move_xy(0, i) + text for i, text in enumerate(lines))
+    sys.stdout.write(frame)
+    sys.stdout.flush()
+
+
 def debug_keys():
     """Debug key input - shows what blessed receives."""
     print("Debug Key Tester")
@@ -22,47 +33,34 @@ def debug_keys():
         try:
             line = 0
             while True:
-                key = term.inkey(timeout=0.1)
+                key = term.inkey()  # blocks until input, no idle wakeups
                 if key:
+                    key_str = str(key)
+                    name = key.name
+
                     # Display key info
                     info_lines = [
                         f"Key received:",
-                        f"  str(key) = {repr(str(key))}",
-                        f"  key.name = {key.name}",
+                        f"  str(key) = {repr(key_str)}",
+                        f"  key.name = {name}",
                         f"  key.code = {key.code}",
                         f"  key.is_sequence = {key.is_sequence}",
                         f"  len(key) = {len(key)}",
                     ]
 
                     # Check specific key values
-                    key_str = str(key)
-                    if key_str == '\x03':
-                        info_lines.append("  -> Ctrl+C detected! Exiting...")
-                        print(term.clear())
-                        for i, line_text in enumerate(info_lines):
-                            print(term.move_xy(0, i) + line_text)
-                        break
-                    elif key_str == '\x1b' or key.name == "KEY_ESCAPE":
-                        info_lines.append("  -> Escape detected! Exiting...")
-                        print(term.clear())
-                        for i, line_text in enumerate(info_lines):
-                            print(term.move_xy(0, i) + line_text)
-                        break
-                    elif key_str == 'q':
-                        info_lines.append("  -> 'q' detected! Exiting...")
-                        print(term.clear())
-                        for i, line_text in enumerate(info_lines):
-                            print(term.move_xy(0, i) + line_text)
+                    exit_label = EXIT_KEYS.get(key_str) or EXIT_KEY_NAMES.get(name)
+                    if exit_label:
+                        info_lines.append(f"  -> {exit_label} detected! Exiting...")
+                        show(info_lines)
                         break
-                    elif key.name == "KEY_TAB":
+                    if name == "KEY_TAB":
                         info_lines.append("  -> Tab detected!")
-                    elif "MOUSE" in str(key.name or ""):
+                    elif "MOUSE" in (name or ""):
                         info_lines.append("  -> Mouse event detected!")
 
                     # Print info
-                    print(term.clear())
-                    for i, line_text in enumerate(info_lines):
-                        print(term.move_xy(0, i) + line_text)
+                    show(info_lines)
 
         finally:
             print(term.exit_mouse_tracking, end="", flush=True)
@@ -7,6 +7,7 @@ Usage:
     python run.py todo_list.py
 """
 
+import marshal
 import sys
 import os
 from pathlib import Path
@@ -19,6 +20,29 @@ sys.path.insert(0, str(repo_root))
 from rawgui.compat import inject
 inject()
 
+def load_code(sample_path: Path):
+    """Compile a sample, reusing the code object cached from an earlier run.
+
+    The cache lives in ``__pycache__`` next to the sample and is rebuilt
+    whenever the sample is newer than it. Marshal data is tied to the
+    interpreter version, so the file name carries the cache tag.
+    """
+    cache = sample_path.parent / "__pycache__" / f"{sample_path.stem}.{sys.implementation.cache_tag}.rawgui.pyc"
+    try:
+        if cache.stat().st_mtime_ns >= sample_path.stat().st_mtime_ns:
+            return marshal.loads(cache.read_bytes())
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+
+    code = compile(sample_path.read_text(), str(sample_path), "exec")
+    try:
+        cache.parent.mkdir(exist_ok=True)
+        cache.write_bytes(marshal.dumps(code))
+    except OSError:
+        pass  # Read-only checkout: just run without caching
+    return code
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python run.py <sample.py>")
@@ -39,16 +63,13 @@ def main():
     print(f"Running {sample} with RawGUI...")
     print("-" * 40)
 
-    # Read and exec the sample
-    code = sample_path.read_text()
-
     # Set up globals for exec
     exec_globals = {
         "__name__": "__main__",
         "__file__": str(sample_path),
     }
 
-    exec(compile(code, sample_path, "exec"), exec_globals)
+    exec(load_code(sample_path), exec_globals)
 
 
 if __name__ == "__main__":
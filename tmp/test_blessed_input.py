@@ -18,7 +18,7 @@ with term.fullscreen(), term.cbreak(), term.hidden_cursor():
     try:
         running = True
         while running:
-            key = term.inkey(timeout=0.05)
+            key = term.inkey()  # blocks until input, no idle wakeups
             if key:
                 # Print key info
                 info = f"Key: repr={repr(key)}, name={key.name}, code={key.code}, is_sequence={key.is_sequence}"